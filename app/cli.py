@@ -5,9 +5,10 @@ This module provides the command-line interface for Meetscribe, a tool to
 automatically convert audio recordings of meetings into structured notes.
 """
 
+import os
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 import typer
 from typer import Option
@@ -26,7 +27,7 @@ from app.services.llm_notes import LLMNotesGenerator
 from app.services.calendar_linker import CalendarLinker
 from app.services.meeting_notes import EventNotesGenerator
 from app.services.dir_watcher import DirectoryWatcher
-from app.services.audio_tools import remove_silence
+from app.services.audio_tools import iter_remove_silence_batch
 from app.ui import interactive_select_files, interactive_select_events
 from app.transcriber import Transcriber, SUPPORTED_EXTENSIONS
 from app.integrations.google_calendar import GoogleCalendarClient
@@ -779,8 +780,10 @@ def calendar_past(
     limit: Optional[int] = typer.Option(
         None, "--limit", "-n", help="Max number of events (defaults to config)."
     ),
-    calendar_id: Optional[str] = typer.Option(
-        None, "--calendar-id", help="Calendar ID (defaults to config)."
+    calendar_id: Optional[List[str]] = typer.Option(
+        None,
+        "--calendar-id",
+        help="Calendar ID (defaults to config). Repeat to query several calendars concurrently.",
     ),
     group_only: Optional[bool] = typer.Option(
         None,
@@ -801,12 +804,25 @@ def calendar_past(
     try:
         # Initialize Google Calendar client with new signature
         client = GoogleCalendarClient(ctx.config.google, ctx.logger)
-        events = client.list_past_events(
-            days=days,
-            limit=limit,
-            calendar_id=calendar_id,
-            filter_group_events=group_only,
-        )
+        if calendar_id and len(calendar_id) > 1:
+            # Query all calendars concurrently and merge by start time
+            events_by_calendar = client.list_past_events_for_calendars(
+                calendar_id,
+                days=days,
+                limit=limit,
+                filter_group_events=group_only,
+            )
+            events = sorted(
+                (e for evs in events_by_calendar.values() for e in evs),
+                key=GoogleCalendarClient.event_start_timestamp,
+            )
+        else:
+            events = client.list_past_events(
+                days=days,
+                limit=limit,
+                calendar_id=calendar_id[0] if calendar_id else None,
+                filter_group_events=group_only,
+            )
 
         if not events:
             console.print(
@@ -1046,6 +1062,7 @@ def audio_trim_silence(
     min_silence_len: int = Option(1000, "--min-silence-len", help="Minimum length of silence to detect (milliseconds)"),
     silence_thresh: int = Option(-40, "--silence-thresh", help="Silence threshold in dBFS"),
     keep_silence: int = Option(100, "--keep-silence", help="Amount of silence to keep around detected segments (milliseconds)"),
+    workers: Optional[int] = Option(None, "--workers", min=1, help="Number of files to process in parallel (defaults to CPU count)"),
 ):
     """
     Remove silence from audio files using PyDub.
@@ -1082,9 +1099,14 @@ def audio_trim_silence(
             ctx.logger.error(f"Unsupported file extension: {input_path.suffix}. Supported: {', '.join(SUPPORTED_EXTENSIONS)}")
             raise typer.Exit(code=1)
     elif input_path.is_dir():
-        for file_path in input_path.iterdir():
-            if file_path.is_file() and file_path.suffix.lower() in SUPPORTED_EXTENSIONS:
-                files_to_process.append(file_path)
+        # Check the extension first; DirEntry.is_file() reuses the type from the listing
+        with os.scandir(input_path) as it:
+            files_to_process = [
+                Path(entry.path)
+                for entry in it
+                if os.path.splitext(entry.name)[1].lower() in SUPPORTED_EXTENSIONS
+                and entry.is_file()
+            ]
         if not files_to_process:
             ctx.logger.warning(f"No supported audio files found in {input_path}")
             return
@@ -1092,35 +1114,35 @@ def audio_trim_silence(
         ctx.logger.error(f"Path is neither a file nor directory: {input_path}")
         raise typer.Exit(code=1)
 
-    # Process files
-    processed_count = 0
+    # Determine output paths
+    pairs = []
     for file_path in files_to_process:
-        try:
-            # Determine output path
-            if output_dir:
-                output_path = output_dir / file_path.name
-            else:
-                # Add .nosil suffix before extension
-                stem = file_path.stem
-                suffix = file_path.suffix
-                output_path = file_path.parent / f"{stem}.nosil{suffix}"
-
-            ctx.logger.info(f"Processing {file_path.name} -> {output_path.name}")
-
-            # Remove silence
-            result_path = remove_silence(
-                input_path=file_path,
-                output_path=output_path,
-                min_silence_len=min_silence_len,
-                silence_thresh=silence_thresh,
-                keep_silence=keep_silence,
-            )
+        if output_dir:
+            output_path = output_dir / file_path.name
+        else:
+            # Add .nosil suffix before extension
+            stem = file_path.stem
+            suffix = file_path.suffix
+            output_path = file_path.parent / f"{stem}.nosil{suffix}"
 
-            ctx.logger.info(f"Successfully processed: {result_path}")
-            processed_count += 1
+        ctx.logger.info(f"Processing {file_path.name} -> {output_path.name}")
+        pairs.append((file_path, output_path))
 
-        except Exception as e:
-            ctx.logger.error(f"Failed to process {file_path.name}: {e}")
+    # Process files in parallel
+    processed_count = 0
+    for file_path, result_path, error in iter_remove_silence_batch(
+        pairs,
+        workers=workers,
+        min_silence_len=min_silence_len,
+        silence_thresh=silence_thresh,
+        keep_silence=keep_silence,
+    ):
+        if error is not None:
+            ctx.logger.error(f"Failed to process {file_path.name}: {error}")
+            continue
+
+        ctx.logger.info(f"Successfully processed: {result_path}")
+        processed_count += 1
 
     # Summary
     ctx.logger.info(f"Processed {processed_count}/{len(files_to_process)} files successfully")
@@ -50,6 +50,7 @@ class ProcessingConfig(BaseModel):
     reprocess: bool = False
     soft_limit_files: int = 10
     hard_limit_files: int = 25
+    batch_concurrency: int = 2
 
 
 class UIConfig(BaseModel):
@@ -186,6 +187,8 @@ class LLMConfig(BaseModel):
     model: str = "gpt-4o-mini"
     temperature: float = 0.2
     default_modes: str = ""
+    max_concurrent_requests: int = 16
+    max_input_tokens: int = 0
     prompts: LLMPromptsConfig = LLMPromptsConfig()
     paths: LLMPathsConfig = LLMPathsConfig()
     keys: LLMKeysConfig = LLMKeysConfig()
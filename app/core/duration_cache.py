@@ -0,0 +1,127 @@
+"""
+Persistent audio duration cache for Meetscribe.
+
+Reading an audio file's duration means parsing its header (or running
+ffprobe), which dominates the start-up time of the interactive file picker.
+Durations are remembered between runs, keyed by path and invalidated as soon
+as the file's modification time or size changes. Entries for files that no
+longer exist are dropped when the cache is saved.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+DEFAULT_CACHE_FILE = Path.home() / ".meetscribe" / "durations.json"
+
+
+class DurationCache:
+    """
+    Audio durations keyed by path, valid while mtime and size are unchanged.
+
+    Lookups and updates may come from worker threads; saving writes a
+    snapshot, so it is safe while workers are still running.
+    """
+
+    def __init__(self, cache_file: Path = DEFAULT_CACHE_FILE, logger=None):
+        """
+        Load the cache from disk, starting empty if it is missing or unreadable.
+
+        Args:
+            cache_file: JSON file the cache is stored in
+            logger: Optional logger instance
+        """
+        self.cache_file = cache_file
+        self.logger = logger
+        self._dirty = False
+        # path -> [mtime_ns, size, duration in seconds or None]
+        self._entries: Dict[str, List] = self._load()
+        # Paths looked up this session; these are known to exist
+        self._seen: Set[str] = set()
+
+    def _load(self) -> Dict[str, List]:
+        """Read entries from the cache file."""
+        try:
+            with open(self.cache_file, "rb") as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson else json.loads(raw)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            if self.logger:
+                self.logger.debug(f"Ignoring unreadable duration cache: {e}")
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def get(self, path: Path, stat: os.stat_result) -> Tuple[bool, Optional[float]]:
+        """
+        Look up the cached duration of a file.
+
+        Args:
+            path: Audio file path
+            stat: Current stat result of the file
+
+        Returns:
+            Tuple of (hit, duration); duration may be None for unreadable files
+        """
+        key = str(path)
+        self._seen.add(key)
+        entry = self._entries.get(key)
+        if (
+            entry is not None
+            and len(entry) == 3
+            and entry[0] == stat.st_mtime_ns
+            and entry[1] == stat.st_size
+        ):
+            return True, entry[2]
+        return False, None
+
+    def put(self, path: Path, stat: os.stat_result, duration: Optional[float]) -> None:
+        """
+        Remember the duration of a file.
+
+        Args:
+            path: Audio file path
+            stat: Stat result the duration was read under
+            duration: Duration in seconds, or None if it couldn't be determined
+        """
+        key = str(path)
+        self._seen.add(key)
+        self._entries[key] = [stat.st_mtime_ns, stat.st_size, duration]
+        self._dirty = True
+
+    def save(self) -> None:
+        """
+        Write the cache to disk if anything changed, replacing the file atomically.
+
+        Entries for paths not looked up this session are kept only while their
+        file still exists, so deleted, renamed or moved files don't accumulate.
+        """
+        if not self._dirty:
+            return
+        self._dirty = False
+        seen = set(self._seen)
+        entries = {
+            path: entry
+            for path, entry in list(self._entries.items())
+            if path in seen or os.path.exists(path)
+        }
+        payload = (
+            orjson.dumps(entries) if orjson else json.dumps(entries).encode("utf-8")
+        )
+        tmp_file = self.cache_file.with_name(f".{self.cache_file.name}.tmp")
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_file, self.cache_file)
+        except OSError as e:
+            tmp_file.unlink(missing_ok=True)
+            if self.logger:
+                self.logger.debug(f"Failed to save duration cache: {e}")
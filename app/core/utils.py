@@ -5,9 +5,14 @@ This module contains common functionality that can be reused across
 different components of the application.
 """
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Set
 import logging
+import re
+
+# Characters not allowed in sanitized filename components
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r"[^a-zA-Z0-9\-_\s]")
 
 
 def ensure_directory_exists(
@@ -245,10 +250,13 @@ def format_time_ago(value) -> str:
         return f"{max(1, years)}y"
 
 
+@lru_cache(maxsize=4096)
 def sanitize_filename(name: str, replacement: str = "_", max_length: int = 80) -> str:
     """
     Sanitize a string to make it safe for use as a filename component.
 
+    Results are memoized, since recurring events sanitize the same titles.
+
     Args:
         name: The original string to sanitize
         replacement: Character to replace invalid sequences with
@@ -257,8 +265,6 @@ def sanitize_filename(name: str, replacement: str = "_", max_length: int = 80) -
     Returns:
         Sanitized string safe for filesystem use
     """
-    import re
-
     if not name:
         return "untitled"
 
@@ -266,7 +272,7 @@ def sanitize_filename(name: str, replacement: str = "_", max_length: int = 80) -
     name = name.strip()
 
     # Replace sequences of non-alphanumeric/dash/underscore/space with replacement
-    name = re.sub(r"[^a-zA-Z0-9\-_\s]", replacement, name)
+    name = _UNSAFE_FILENAME_CHARS_RE.sub(replacement, name)
 
     # Convert spaces to replacement
     name = name.replace(" ", replacement)
@@ -289,7 +295,13 @@ def sanitize_filename(name: str, replacement: str = "_", max_length: int = 80) -
     return name
 
 
-def generate_unique_path(base: Path, stem: str, ext: str) -> Path:
+def generate_unique_path(
+    base: Path,
+    stem: str,
+    ext: str,
+    taken: Optional[Set[Path]] = None,
+    existing_stems: Optional[Set[str]] = None,
+) -> Path:
     """
     Generate a unique file path, avoiding overwrites by adding suffixes if needed.
 
@@ -297,22 +309,35 @@ def generate_unique_path(base: Path, stem: str, ext: str) -> Path:
         base: Base directory path
         stem: Filename stem (without extension)
         ext: File extension (with dot, e.g., ".txt")
+        taken: Optional paths to treat as unavailable even if not yet on disk
+        existing_stems: Optional stems of the files with this extension already
+            in the base directory; when given, candidates are checked against it
+            instead of the filesystem
 
     Returns:
         Unique file path that doesn't exist in the base directory
     """
     if not ext.startswith("."):
         ext = "." + ext
+    taken = taken or set()
+
+    def available(candidate_stem: str, candidate: Path) -> bool:
+        if candidate in taken:
+            return False
+        if existing_stems is not None:
+            return candidate_stem not in existing_stems
+        return not candidate.exists()
 
     candidate = base / f"{stem}{ext}"
-    if not candidate.exists():
+    if available(stem, candidate):
         return candidate
 
     # Add suffixes like " (1)", " (2)", etc.
     counter = 1
     while True:
-        candidate = base / f"{stem} ({counter}){ext}"
-        if not candidate.exists():
+        candidate_stem = f"{stem} ({counter})"
+        candidate = base / f"{candidate_stem}{ext}"
+        if available(candidate_stem, candidate):
             return candidate
         counter += 1
 
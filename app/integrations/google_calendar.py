@@ -5,19 +5,60 @@ This module provides integration with Google Calendar API to list past events
 with attendees, descriptions, and attachment information.
 """
 
+import asyncio
 import json
+import re
+import threading
+import time
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
-
-from googleapiclient.discovery import build
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
+from typing import Iterator, List, Dict, Any, Optional, Tuple
 
 from app.core.config_models import GoogleConfig
 from app.core.exceptions import ConfigurationError, GoogleCalendarError
 from app.core.utils import ensure_directory_exists
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Partial response mask: only the event fields Meetscribe actually reads
+EVENT_LIST_FIELDS = (
+    "items(id,summary,description,attendees(email,displayName),"
+    "attachments(fileUrl,title),start,end,htmlLink,organizer(email)),nextPageToken"
+)
+
+# Repeated identical list_past_events queries within this window reuse the last result
+EVENTS_CACHE_TTL_SECONDS = 60
+EVENTS_CACHE_MAX_ENTRIES = 64
+
+# Email domains whose attendees are shown by username only (matched after the '@')
+_SHORT_NAME_DOMAIN_RE = re.compile(r"indeed", re.IGNORECASE)
+
+
+def _orjson_model():
+    """
+    Build a googleapiclient JsonModel that parses API responses with orjson.
+
+    Defined lazily so googleapiclient is only imported when a service is built.
+
+    Returns:
+        JsonModel instance, or None if orjson is not installed
+    """
+    if orjson is None:
+        return None
+
+    from googleapiclient.model import JsonModel
+
+    class _OrjsonModel(JsonModel):
+        def deserialize(self, content):
+            body = orjson.loads(content)
+            if self._data_wrapper and "data" in body:
+                body = body["data"]
+            return body
+
+    return _OrjsonModel(data_wrapper=False)
+
 
 class GoogleCalendarClient:
     """
@@ -53,6 +94,15 @@ class GoogleCalendarClient:
         # Ensure token directory exists
         ensure_directory_exists(self.cfg.token_file.parent, self.logger)
 
+        # Authorized HTTP session used for streamed event listing (created lazily)
+        self._creds = None
+        self._session = None
+        # Worker threads may request the session at the same time
+        self._session_lock = threading.Lock()
+
+        # (calendar_id, days, limit, filter_group_events) -> (fetched_at_mono, events)
+        self._events_cache: Dict[tuple, Tuple[float, List[Dict[str, Any]]]] = {}
+
         # Initialize the service
         self.service = self._get_service()
 
@@ -68,16 +118,23 @@ class GoogleCalendarClient:
         Raises:
             ConfigurationError: If authentication fails
         """
+        # Imported here to keep CLI startup fast for commands that never use Google
+        from googleapiclient.discovery import build
+        from google.oauth2.credentials import Credentials
+        from google_auth_oauthlib.flow import InstalledAppFlow
+        from google.auth.transport.requests import Request
+
         creds = None
 
         # Load existing token if available
         if self.cfg.token_file.exists():
             try:
-                with open(self.cfg.token_file, "r") as token:
-                    token_data = json.load(token)
-                    creds = Credentials.from_authorized_user_info(
-                        token_data, self.cfg.scopes
-                    )
+                with open(self.cfg.token_file, "rb") as token:
+                    raw = token.read()
+                token_data = orjson.loads(raw) if orjson else json.loads(raw)
+                creds = Credentials.from_authorized_user_info(
+                    token_data, self.cfg.scopes
+                )
                 self.logger.debug("Loaded existing token from file")
             except Exception as e:
                 self.logger.warning(f"Failed to load existing token: {e}")
@@ -125,15 +182,22 @@ class GoogleCalendarClient:
                     "client_secret": creds.client_secret,
                     "scopes": creds.scopes,
                 }
-                with open(self.cfg.token_file, "w") as token:
-                    json.dump(token_data, token)
+                payload = (
+                    orjson.dumps(token_data)
+                    if orjson
+                    else json.dumps(token_data).encode("utf-8")
+                )
+                with open(self.cfg.token_file, "wb") as token:
+                    token.write(payload)
                 self.logger.debug("Saved token to file")
             except Exception as e:
                 self.logger.warning(f"Failed to save token: {e}")
 
+        self._creds = creds
+
         # Build the service
         try:
-            service = build("calendar", "v3", credentials=creds)
+            service = build("calendar", "v3", credentials=creds, model=_orjson_model())
             self.logger.info("Google Calendar service initialized successfully")
             return service
         except Exception as e:
@@ -142,6 +206,83 @@ class GoogleCalendarClient:
                 f"Failed to initialize Google Calendar service: {e}"
             ) from e
 
+    def _get_session(self):
+        """
+        Get the authorized HTTP session, creating it on first use.
+
+        The session keeps connections alive between calls and refreshes the
+        OAuth token transparently.
+
+        Returns:
+            AuthorizedSession bound to the client's credentials
+        """
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    from google.auth.transport.requests import AuthorizedSession
+
+                    self._session = AuthorizedSession(self._creds)
+        return self._session
+
+    def _new_http(self):
+        """
+        Build an authorized httplib2 transport for a single request.
+
+        httplib2 is not thread-safe, so each execute() gets its own transport
+        instead of sharing the discovery client's, letting calendars queried
+        from worker threads run in parallel.
+
+        Returns:
+            AuthorizedHttp bound to the client's credentials
+        """
+        from google_auth_httplib2 import AuthorizedHttp
+        from googleapiclient.http import build_http
+
+        return AuthorizedHttp(self._creds, http=build_http())
+
+    def _iter_event_items(self, request) -> Iterator[Dict[str, Any]]:
+        """
+        Yield event items from an events().list() request as they arrive.
+
+        When ``ijson`` is installed, the response body is streamed and parsed
+        incrementally so events are available before the whole page has been
+        downloaded. Otherwise, or if streaming fails before any event has been
+        yielded, falls back to ``request.execute()``. A failure after events
+        have been yielded is re-raised, since a second request could return a
+        different list and the caller already holds part of the first.
+
+        Args:
+            request: HttpRequest returned by ``service.events().list(...)``
+
+        Yields:
+            Event dictionaries from the response ``items`` array
+        """
+        yielded = 0
+        try:
+            import ijson
+
+            response = self._get_session().get(request.uri, stream=True)
+            try:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                for item in ijson.items(response.raw, "items.item", use_float=True):
+                    yielded += 1
+                    yield item
+            finally:
+                response.close()
+            return
+        except ImportError:
+            pass
+        except Exception as e:
+            if yielded:
+                raise
+            self.logger.debug(
+                f"Streaming event parse failed, falling back to execute(): {e}"
+            )
+
+        result = request.execute(http=self._new_http())
+        yield from result.get("items", [])
+
     def list_past_events(
         self,
         days: Optional[int] = None,
@@ -174,6 +315,13 @@ class GoogleCalendarClient:
             else self.cfg.filter_group_events_only
         )
 
+        # Serve repeated identical queries from the short-lived cache
+        cache_key = (calendar_id, days, limit, filter_group_events)
+        cached = self._events_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < EVENTS_CACHE_TTL_SECONDS:
+            self.logger.debug(f"Using cached past events for {cache_key}")
+            return list(cached[1])
+
         # Calculate time range
         now = datetime.utcnow()
         time_max = now.isoformat() + "Z"
@@ -184,41 +332,107 @@ class GoogleCalendarClient:
         )
 
         try:
-            events_result = (
-                self.service.events()
-                .list(
-                    calendarId=calendar_id,
-                    timeMin=time_min,
-                    timeMax=time_max,
-                    singleEvents=True,
-                    orderBy="startTime",
-                    maxResults=limit,
-                    fields="items(id,summary,description,attendees(email,displayName,responseStatus),attachments(fileUrl,title,mimeType,iconLink),start,end,htmlLink),nextPageToken",
-                )
-                .execute()
+            request = self.service.events().list(
+                calendarId=calendar_id,
+                timeMin=time_min,
+                timeMax=time_max,
+                singleEvents=True,
+                orderBy="startTime",
+                maxResults=limit,
+                fields=EVENT_LIST_FIELDS,
             )
-
-            events = events_result.get("items", [])
+            events = list(self._iter_event_items(request))
             self.logger.info(f"Retrieved {len(events)} past events")
 
             # Filter events based on attendee count if requested
             if filter_group_events:
-                filtered_events = []
-                for event in events:
-                    attendees = event.get("attendees", [])
-                    if len(attendees) >= 2:
-                        filtered_events.append(event)
-                events = filtered_events
+                events = [e for e in events if len(e.get("attendees") or ()) >= 2]
                 self.logger.info(
                     f"Filtered to {len(events)} group events (2 or more attendees)"
                 )
 
-            return events
+            self._events_cache.pop(cache_key, None)
+            if len(self._events_cache) >= EVENTS_CACHE_MAX_ENTRIES:
+                # Evict the oldest entry (dicts keep insertion order)
+                self._events_cache.pop(next(iter(self._events_cache)))
+            self._events_cache[cache_key] = (time.monotonic(), events)
+
+            return list(events)
 
         except Exception as e:
             self.logger.error(f"Failed to list calendar events: {e}")
             raise GoogleCalendarError(f"Failed to list calendar events: {e}") from e
 
+    def invalidate_events(self) -> None:
+        """Drop all cached list_past_events results."""
+        self._events_cache.clear()
+
+    async def list_past_events_async(
+        self,
+        calendar_ids: List[str],
+        days: Optional[int] = None,
+        limit: Optional[int] = None,
+        filter_group_events: Optional[bool] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        List past events from several calendars concurrently.
+
+        Each calendar is queried on a worker thread so the requests overlap
+        instead of waiting on each other's network latency.
+
+        Args:
+            calendar_ids: Calendar IDs to query
+            days: Number of past days to look back (uses config default if None)
+            limit: Maximum number of events per calendar (uses config default if None)
+            filter_group_events: If True, only return events with 2 or more attendees (uses config default if None)
+
+        Returns:
+            Dictionary mapping each calendar ID to its list of events
+
+        Raises:
+            GoogleCalendarError: If any API call fails
+        """
+        results = await asyncio.gather(
+            *(
+                asyncio.to_thread(
+                    self.list_past_events, days, limit, calendar_id, filter_group_events
+                )
+                for calendar_id in calendar_ids
+            )
+        )
+        return dict(zip(calendar_ids, results))
+
+    def list_past_events_for_calendars(
+        self,
+        calendar_ids: List[str],
+        days: Optional[int] = None,
+        limit: Optional[int] = None,
+        filter_group_events: Optional[bool] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Synchronous wrapper around list_past_events_async for CLI code.
+
+        Args:
+            calendar_ids: Calendar IDs to query
+            days: Number of past days to look back (uses config default if None)
+            limit: Maximum number of events per calendar (uses config default if None)
+            filter_group_events: If True, only return events with 2 or more attendees (uses config default if None)
+
+        Returns:
+            Dictionary mapping each calendar ID to its list of events
+
+        Raises:
+            GoogleCalendarError: If any API call fails
+        """
+        return asyncio.run(
+            self.list_past_events_async(
+                calendar_ids,
+                days=days,
+                limit=limit,
+                filter_group_events=filter_group_events,
+            )
+        )
+
     def list_events_between(
         self,
         start: datetime,
@@ -267,31 +481,21 @@ class GoogleCalendarClient:
         )
 
         try:
-            events_result = (
-                self.service.events()
-                .list(
-                    calendarId=calendar_id,
-                    timeMin=start_utc,
-                    timeMax=end_utc,
-                    singleEvents=True,
-                    orderBy="startTime",
-                    maxResults=limit,
-                    fields="items(id,summary,description,attendees(email,displayName,responseStatus),attachments(fileUrl,title,mimeType,iconLink),start,end,htmlLink),nextPageToken",
-                )
-                .execute()
+            request = self.service.events().list(
+                calendarId=calendar_id,
+                timeMin=start_utc,
+                timeMax=end_utc,
+                singleEvents=True,
+                orderBy="startTime",
+                maxResults=limit,
+                fields=EVENT_LIST_FIELDS,
             )
-
-            events = events_result.get("items", [])
+            events = list(self._iter_event_items(request))
             self.logger.info(f"Retrieved {len(events)} events between specified times")
 
             # Filter events based on attendee count if requested
             if filter_group_events:
-                filtered_events = []
-                for event in events:
-                    attendees = event.get("attendees", [])
-                    if len(attendees) >= 2:
-                        filtered_events.append(event)
-                events = filtered_events
+                events = [e for e in events if len(e.get("attendees") or ()) >= 2]
                 self.logger.info(
                     f"Filtered to {len(events)} group events (2 or more attendees)"
                 )
@@ -349,31 +553,21 @@ class GoogleCalendarClient:
         )
 
         try:
-            events_result = (
-                self.service.events()
-                .list(
-                    calendarId=calendar_id,
-                    timeMin=time_min,
-                    timeMax=time_max,
-                    singleEvents=True,
-                    orderBy="startTime",
-                    maxResults=limit,
-                    fields="items(id,summary,description,attendees(email,displayName,responseStatus),attachments(fileUrl,title,mimeType,iconLink),start,end,htmlLink),nextPageToken",
-                )
-                .execute()
+            request = self.service.events().list(
+                calendarId=calendar_id,
+                timeMin=time_min,
+                timeMax=time_max,
+                singleEvents=True,
+                orderBy="startTime",
+                maxResults=limit,
+                fields=EVENT_LIST_FIELDS,
             )
-
-            events = events_result.get("items", [])
+            events = list(self._iter_event_items(request))
             self.logger.info(f"Retrieved {len(events)} upcoming events")
 
             # Filter events based on attendee count if requested
             if filter_group_events:
-                filtered_events = []
-                for event in events:
-                    attendees = event.get("attendees", [])
-                    if len(attendees) >= 2:
-                        filtered_events.append(event)
-                events = filtered_events
+                events = [e for e in events if len(e.get("attendees") or ()) >= 2]
                 self.logger.info(
                     f"Filtered to {len(events)} group events (2 or more attendees)"
                 )
@@ -438,31 +632,21 @@ class GoogleCalendarClient:
         )
 
         try:
-            events_result = (
-                self.service.events()
-                .list(
-                    calendarId=calendar_id,
-                    timeMin=start_utc,
-                    timeMax=end_utc,
-                    singleEvents=True,
-                    orderBy="startTime",
-                    maxResults=limit,
-                    fields="items(id,summary,description,attendees(email,displayName,responseStatus),attachments(fileUrl,title,mimeType,iconLink),start,end,htmlLink),nextPageToken",
-                )
-                .execute()
+            request = self.service.events().list(
+                calendarId=calendar_id,
+                timeMin=start_utc,
+                timeMax=end_utc,
+                singleEvents=True,
+                orderBy="startTime",
+                maxResults=limit,
+                fields=EVENT_LIST_FIELDS,
             )
-
-            events = events_result.get("items", [])
+            events = list(self._iter_event_items(request))
             self.logger.info(f"Retrieved {len(events)} events in range")
 
             # Filter events based on attendee count if requested
             if filter_group_events:
-                filtered_events = []
-                for event in events:
-                    attendees = event.get("attendees", [])
-                    if len(attendees) >= 2:
-                        filtered_events.append(event)
-                events = filtered_events
+                events = [e for e in events if len(e.get("attendees") or ()) >= 2]
                 self.logger.info(
                     f"Filtered to {len(events)} group events (2 or more attendees)"
                 )
@@ -475,6 +659,32 @@ class GoogleCalendarClient:
                 f"Failed to list calendar events in range: {e}"
             ) from e
 
+    @staticmethod
+    def event_start_timestamp(event: Dict[str, Any]) -> float:
+        """
+        Get an event's start as a UNIX timestamp, for ordering events.
+
+        All-day events start at local midnight of their date.
+
+        Args:
+            event: Event dictionary from Google Calendar API
+
+        Returns:
+            Start timestamp in seconds, or 0.0 if the event has no start
+        """
+        start = event.get("start", {})
+
+        if "dateTime" in start:
+            dt_str = start["dateTime"]
+            # Handle Python 3.10 compatibility by replacing Z with +00:00
+            if dt_str.endswith("Z"):
+                dt_str = dt_str[:-1] + "+00:00"
+            return datetime.fromisoformat(dt_str).timestamp()
+        elif "date" in start:
+            return datetime.fromisoformat(start["date"]).timestamp()
+        else:
+            return 0.0
+
     @staticmethod
     def parse_event_start_local(event: Dict[str, Any]) -> str:
         """
@@ -525,9 +735,10 @@ class GoogleCalendarClient:
             if not name:
                 # If no displayName, use email but check for Indeed domain
                 email = attendee.get("email", "")
-                if email and "indeed" in email.lower():
+                at = email.rfind("@")
+                if at > 0 and _SHORT_NAME_DOMAIN_RE.search(email, at):
                     # For Indeed emails, show only username part before @
-                    name = email.split("@")[0]
+                    name = email[:at]
                 else:
                     name = email
 
@@ -5,11 +5,12 @@ This module provides functionality for audio preprocessing, including silence re
 and format handling.
 """
 
+import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Iterator, List, Optional, Tuple
 
-from pydub import AudioSegment
-from pydub.silence import split_on_silence
+from app.core.utils import get_audio_duration
 
 
 def infer_export_format(ext: str) -> str:
@@ -35,6 +36,26 @@ def infer_export_format(ext: str) -> str:
     return format_map.get(ext_lower, ext_lower)
 
 
+def _copy_if_same_format(input_path: Path, output_path: Path) -> bool:
+    """
+    Copy the input file verbatim when input and output share the same extension.
+
+    Used when silence removal would leave the audio unchanged, avoiding a full
+    decode and re-encode of the file.
+
+    Args:
+        input_path: Path to input audio file
+        output_path: Path to write the copy to
+
+    Returns:
+        bool: True if the file was copied, False if formats differ
+    """
+    if input_path.suffix.lower() != output_path.suffix.lower():
+        return False
+    shutil.copyfile(input_path, output_path)
+    return True
+
+
 def remove_silence(
     input_path: Path,
     output_path: Path,
@@ -62,7 +83,17 @@ def remove_silence(
     if not input_path.exists():
         raise FileNotFoundError(f"Input file not found: {input_path}")
 
+    # Imported here because pydub probes for ffmpeg at import time
+    from pydub import AudioSegment
+    from pydub.silence import split_on_silence
+
     try:
+        # Audio shorter than the minimum silence length cannot contain a removable gap
+        duration = get_audio_duration(input_path)
+        if duration is not None and duration * 1000 < min_silence_len:
+            if _copy_if_same_format(input_path, output_path):
+                return output_path
+
         # Load audio file
         audio = AudioSegment.from_file(input_path)
 
@@ -74,8 +105,12 @@ def remove_silence(
             keep_silence=keep_silence,
         )
 
-        # Handle case with no chunks (entirely silence or single segment)
-        if not chunks:
+        # Handle case with no chunks (entirely silence) or no silence found at all
+        if not chunks or (len(chunks) == 1 and len(chunks[0]) == len(audio)):
+            # Output would equal the input; copy instead of re-encoding when possible
+            if _copy_if_same_format(input_path, output_path):
+                return output_path
+
             # Export the original audio unchanged
             export_format = infer_export_format(output_path.suffix)
             audio.export(output_path, format=export_format)
@@ -93,3 +128,86 @@ def remove_silence(
 
     except Exception as e:
         raise Exception(f"Failed to process audio file {input_path}: {e}")
+
+
+class _SilenceBatchResults:
+    """Iterable over the results of iter_remove_silence_batch with a known length."""
+
+    def __init__(
+        self,
+        pairs: List[Tuple[Path, Path]],
+        results: Iterator[Tuple[Path, Path, Optional[Exception]]],
+    ):
+        self._count = len(pairs)
+        self._results = results
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[Tuple[Path, Path, Optional[Exception]]]:
+        return self._results
+
+
+def iter_remove_silence_batch(
+    pairs: List[Tuple[Path, Path]],
+    workers: Optional[int] = None,
+    min_silence_len: int = 1000,
+    silence_thresh: int = -40,
+    keep_silence: int = 100,
+) -> _SilenceBatchResults:
+    """
+    Remove silence from several files in parallel, producing results as they finish.
+
+    Each file is handled by ``remove_silence`` in a separate worker process, since
+    silence detection is CPU-bound Python code. The result has a known length
+    (``len(pairs)``), so it can be wrapped in a progress bar such as ``tqdm``.
+    Files are only processed while the result is being iterated.
+
+    Args:
+        pairs: List of (input_path, output_path) tuples
+        workers: Maximum number of worker processes (defaults to CPU count)
+        min_silence_len: Minimum length of silence to detect (in milliseconds)
+        silence_thresh: Silence threshold in dBFS (negative value)
+        keep_silence: Amount of silence to keep around detected segments (in milliseconds)
+
+    Returns:
+        Iterable of (input_path, output_path, error) tuples in completion order,
+        where error is None on success or the exception raised for that file
+    """
+    options = {
+        "min_silence_len": min_silence_len,
+        "silence_thresh": silence_thresh,
+        "keep_silence": keep_silence,
+    }
+    return _SilenceBatchResults(pairs, _iter_remove_silence(pairs, workers, options))
+
+
+def _iter_remove_silence(
+    pairs: List[Tuple[Path, Path]],
+    workers: Optional[int],
+    options: Dict[str, int],
+) -> Iterator[Tuple[Path, Path, Optional[Exception]]]:
+    """Run remove_silence over the pairs, yielding results as they finish."""
+    # Not worth spawning processes for a single file or a single worker
+    if len(pairs) <= 1 or workers == 1:
+        for input_path, output_path in pairs:
+            try:
+                yield input_path, remove_silence(input_path, output_path, **options), None
+            except Exception as e:
+                yield input_path, output_path, e
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(remove_silence, input_path, output_path, **options): (
+                input_path,
+                output_path,
+            )
+            for input_path, output_path in pairs
+        }
+        for future in as_completed(futures):
+            input_path, output_path = futures[future]
+            try:
+                yield input_path, future.result(), None
+            except Exception as e:
+                yield input_path, output_path, e
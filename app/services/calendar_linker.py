@@ -5,9 +5,13 @@ This module provides functionality to link audio files to Google Calendar events
 by matching modification times within a configurable tolerance window.
 """
 
+from bisect import bisect_left
 from datetime import datetime, timedelta
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
+import logging
+import time
 
 from app.core.config_models import GoogleConfig
 from app.core.utils import sanitize_filename
@@ -15,6 +19,100 @@ from app.integrations.google_calendar import GoogleCalendarClient
 from app.core.exceptions import GoogleCalendarError
 
 
+def _parse_iso_datetime(value: str) -> datetime:
+    """Parse an RFC 3339 timestamp, accepting a trailing Z on Python 3.10."""
+    if value[-1:] == "Z":
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
+# Files whose modification times fall within this span share one events request
+_MAX_PREFETCH_SPAN = timedelta(days=1)
+
+# Upper bound accepted by the Calendar API for maxResults
+_MAX_PREFETCH_RESULTS = 2500
+
+# Event descriptions longer than this are truncated in the metadata block
+_DESCRIPTION_MAX_CHARS = 300
+
+# How long a time window known to contain no events is trusted, and how many are kept
+_EMPTY_WINDOW_TTL_SECONDS = 300
+_EMPTY_WINDOW_MAX_ENTRIES = 64
+
+# How long an automatic match for an unchanged file is reused, and how many are kept
+_MATCH_CACHE_TTL_SECONDS = 300
+_MATCH_CACHE_MAX_ENTRIES = 1024
+
+
+def _summarize_names(names: List[str], limit: int) -> str:
+    """Join up to ``limit`` names, noting how many more were left out."""
+    if not names:
+        return "None"
+    if len(names) <= limit:
+        return ", ".join(names)
+    return ", ".join(names[:limit]) + f" +{len(names) - limit} more"
+
+
+class _EventIndex:
+    """
+    Calendar events sorted by start time for bisect-based matching.
+
+    Start and end times are kept as parallel lists of POSIX timestamps, which
+    compare much faster than aware datetimes. Alongside the sorted starts, keeps
+    the running maximum end time (and the first event reaching it) so the
+    closest event starting before a given moment is found in O(log n) instead
+    of scanning every event.
+    """
+
+    def __init__(self, parsed: List[Tuple[datetime, datetime, Dict[str, Any]]]):
+        """
+        Build the index from parsed events.
+
+        Args:
+            parsed: List of (local_start, local_end, event) tuples in any order
+        """
+        parsed.sort(key=itemgetter(0))
+        self.starts: List[float] = [start.timestamp() for start, _, _ in parsed]
+        self.ends: List[float] = [end.timestamp() for _, end, _ in parsed]
+        self.events = [event for _, _, event in parsed]
+
+        self.max_end: List[float] = []
+        self.max_end_idx: List[int] = []
+        best_end, best_idx = float("-inf"), -1
+        for i, end in enumerate(self.ends):
+            if end > best_end:
+                best_end, best_idx = end, i
+            self.max_end.append(best_end)
+            self.max_end_idx.append(best_idx)
+
+    def count_before(self, moment: float) -> int:
+        """Return how many events start strictly before the given timestamp."""
+        return bisect_left(self.starts, moment)
+
+    def closest_before(self, moment: float, cutoff: int) -> Optional[int]:
+        """
+        Find the event closest to a moment among the first ``cutoff`` events.
+
+        All candidates start before the moment, so an event's distance is zero
+        while it is still running and otherwise the time since it ended. The
+        earliest-starting event still running wins; failing that, the event
+        that ended last.
+
+        Args:
+            moment: Reference time as a POSIX timestamp
+            cutoff: Number of leading events to consider (see count_before)
+
+        Returns:
+            Index of the closest event, or None if there are no candidates
+        """
+        if cutoff <= 0:
+            return None
+        running = bisect_left(self.max_end, moment, 0, cutoff)
+        if running < cutoff:
+            return running
+        return self.max_end_idx[cutoff - 1]
+
+
 class CalendarLinker:
     """
     Service for linking audio files to Google Calendar events.
@@ -41,8 +139,75 @@ class CalendarLinker:
         self.logger = logger
         self.select_event_interactively = select_event_interactively
         self.client = GoogleCalendarClient(gcfg, logger)
+        # (window_start_ts, window_end_ts) -> monotonic time the empty result was seen
+        self._empty_windows: Dict[Tuple[float, float], float] = {}
+        # (path, mtime) -> (monotonic time of the match, matched event or None)
+        self._match_cache: Dict[Tuple[str, float], Tuple[float, Optional[Dict[str, Any]]]] = {}
 
-    def match_file(self, file_path: Path) -> Optional[Dict[str, Any]]:
+    def _in_empty_window(self, start: datetime, end: datetime) -> bool:
+        """
+        Check whether a window lies inside one recently seen to have no events.
+
+        Expired entries are dropped on every lookup.
+
+        Args:
+            start: Window start (timezone-aware)
+            end: Window end (timezone-aware)
+
+        Returns:
+            True if the window is known to be empty, False otherwise
+        """
+        now = time.monotonic()
+        start_ts, end_ts = start.timestamp(), end.timestamp()
+        covered = False
+        for key, seen_at in list(self._empty_windows.items()):
+            if now - seen_at > _EMPTY_WINDOW_TTL_SECONDS:
+                del self._empty_windows[key]
+            elif key[0] <= start_ts and end_ts <= key[1]:
+                covered = True
+        return covered
+
+    def _remember_empty_window(self, start: datetime, end: datetime) -> None:
+        """Record that a window had no events, evicting the oldest entry when full."""
+        if len(self._empty_windows) >= _EMPTY_WINDOW_MAX_ENTRIES:
+            oldest = min(self._empty_windows, key=self._empty_windows.get)
+            del self._empty_windows[oldest]
+        self._empty_windows[(start.timestamp(), end.timestamp())] = time.monotonic()
+
+    def _cached_match(self, key: Tuple[str, float]) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """
+        Look up a recent automatic match for an unchanged file.
+
+        Args:
+            key: (path, mtime) of the file
+
+        Returns:
+            Tuple of (hit, event); the event is a copy so callers may annotate it
+        """
+        entry = self._match_cache.get(key)
+        if entry is None:
+            return False, None
+        seen_at, event = entry
+        if time.monotonic() - seen_at > _MATCH_CACHE_TTL_SECONDS:
+            del self._match_cache[key]
+            return False, None
+        return True, dict(event) if event is not None else None
+
+    def _remember_match(
+        self, key: Tuple[str, float], event: Optional[Dict[str, Any]]
+    ) -> None:
+        """Record an automatic match, evicting the oldest entry when full."""
+        if len(self._match_cache) >= _MATCH_CACHE_MAX_ENTRIES:
+            oldest = min(self._match_cache, key=lambda k: self._match_cache[k][0])
+            del self._match_cache[oldest]
+        self._match_cache[key] = (
+            time.monotonic(),
+            dict(event) if event is not None else None,
+        )
+
+    def match_file(
+        self, file_path: Path, mtime: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Match a file to the closest calendar event within tolerance.
 
@@ -51,127 +216,241 @@ class CalendarLinker:
 
         Args:
             file_path: Path to the audio file
+            mtime: Modification time already read by the caller; the file is
+                stat'ed if None
 
         Returns:
             Event dictionary if match found within tolerance, None otherwise
         """
-        try:
-            # Get file modification time as timezone-aware datetime
-            mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
-            mtime_local = mtime.astimezone()  # Convert to local timezone
-
-            # Compute tolerance window
-            tolerance = timedelta(minutes=self.cfg.match_tolerance_minutes)
-            window_start = mtime_local - tolerance
-            window_end = mtime_local + tolerance
-
-            # Fetch events in the window
-            events = self.client.list_events_between(
-                start=window_start, end=window_end, limit=self.cfg.max_results
-            )
+        mtimes = {file_path: mtime} if mtime is not None else None
+        return self.match_files([file_path], mtimes).get(file_path)
 
-            if not events:
-                self.logger.debug(f"No events found in window for {file_path.name}")
-                return None
+    def match_files(
+        self, file_paths: List[Path], mtimes: Optional[Dict[Path, float]] = None
+    ) -> Dict[Path, Any]:
+        """
+        Match several files to calendar events with as few API calls as possible.
 
-            # Filter events that start before file modification time
-            valid_events = []
-            for event in events:
-                # Extract event start/end times
-                event_start, event_end = self._parse_event_times(event)
+        Files whose tolerance windows fall within the same day are grouped and
+        their events fetched with a single request; each file is then matched
+        against the shared in-memory index. If a group's request comes back
+        full, its files are queried one by one instead, so no event is lost to
+        the result limit. Automatic matches are reused for a few minutes while
+        the file's modification time is unchanged.
 
-                if event_start is None:
-                    continue
+        Args:
+            file_paths: Paths to the audio files
+            mtimes: Modification times already read by the caller, keyed by
+                path; files missing from it are stat'ed
+
+        Returns:
+            Dictionary mapping each path to its matched event, None if no match,
+            or USER_CANCELLED if the user skipped interactive selection
+        """
+        results: Dict[Path, Any] = {}
+        tolerance = timedelta(minutes=self.cfg.match_tolerance_minutes)
+
+        # Interactive choices are never cached; the user picks every time
+        use_cache = not self.select_event_interactively
+
+        # Get file modification times as timezone-aware local datetimes
+        dated = []
+        cache_keys: Dict[Path, Tuple[str, float]] = {}
+        for file_path in file_paths:
+            try:
+                mtime = mtimes.get(file_path) if mtimes else None
+                if mtime is None:
+                    mtime = file_path.stat().st_mtime
+                if use_cache:
+                    key = cache_keys[file_path] = (str(file_path), mtime)
+                    hit, event = self._cached_match(key)
+                    if hit:
+                        results[file_path] = event
+                        continue
+                # astimezone() applies the UTC offset in effect at that instant (DST)
+                mtime_local = datetime.fromtimestamp(mtime).astimezone()
+                dated.append((mtime_local, file_path))
+            except Exception as e:
+                self.logger.warning(f"Unexpected error matching {file_path.name}: {e}")
+                results[file_path] = None
+        dated.sort(key=itemgetter(0))
+
+        # Group files so each group's combined window spans at most a day
+        groups: List[List[Tuple[datetime, Path]]] = []
+        for item in dated:
+            if groups and item[0] - groups[-1][0][0] <= _MAX_PREFETCH_SPAN:
+                groups[-1].append(item)
+            else:
+                groups.append([item])
+
+        # Processed as a stack so groups split up below are handled next, in order
+        pending = groups[::-1]
+        while pending:
+            group = pending.pop()
+            window_start = group[0][0] - tolerance
+            window_end = group[-1][0] + tolerance
+
+            # Skip the request if a recent fetch showed this span has no events
+            if self._in_empty_window(window_start, window_end):
+                debug = self.logger.isEnabledFor(logging.DEBUG)
+                for _, file_path in group:
+                    if debug:
+                        self.logger.debug(
+                            f"No calendar events near {file_path.name} (cached empty window)"
+                        )
+                    results[file_path] = None
+                continue
 
-                # Constraint: Event must start before the file modification time
-                # This ensures we're matching recordings to meetings that actually happened
-                if event_start >= mtime_local:
+            try:
+                # Fetch events covering every file in the group at once; the
+                # group filter is applied here so a full page is recognizable
+                limit = min(self.cfg.max_results * len(group), _MAX_PREFETCH_RESULTS)
+                events = self.client.list_events_between(
+                    start=window_start,
+                    end=window_end,
+                    filter_group_events=False,
+                    limit=limit,
+                )
+                if len(group) > 1 and len(events) >= limit:
+                    # Later events may have been cut off; query each file's own
+                    # window instead, as matching them one by one would
                     self.logger.debug(
-                        f"Skipping event '{event.get('summary', 'Unknown')}' - starts after file modification time"
+                        f"Event limit reached for {len(group)} files, querying each file separately"
                     )
+                    pending.extend([item] for item in reversed(group))
                     continue
+                if self.cfg.filter_group_events_only:
+                    events = [e for e in events if len(e.get("attendees") or ()) >= 2]
+                if not events:
+                    self._remember_empty_window(window_start, window_end)
+                index = self._index_events(events)
+            except GoogleCalendarError as e:
+                for _, file_path in group:
+                    self.logger.warning(
+                        f"Failed to match {file_path.name} to calendar event: {e}"
+                    )
+                    results[file_path] = None
+                continue
+            except Exception as e:
+                for _, file_path in group:
+                    self.logger.warning(
+                        f"Unexpected error matching {file_path.name}: {e}"
+                    )
+                    results[file_path] = None
+                continue
+
+            for mtime_local, file_path in group:
+                try:
+                    results[file_path] = self._match_in_index(
+                        file_path, mtime_local, index, mtime_local - tolerance
+                    )
+                    if use_cache:
+                        self._remember_match(cache_keys[file_path], results[file_path])
+                except Exception as e:
+                    self.logger.warning(
+                        f"Unexpected error matching {file_path.name}: {e}"
+                    )
+                    results[file_path] = None
+
+        return results
+
+    def _match_in_index(
+        self,
+        file_path: Path,
+        mtime_local: datetime,
+        index: _EventIndex,
+        window_start: datetime,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Match one file against an index of prefetched events.
 
-                valid_events.append((event, event_start, event_end))
+        Args:
+            file_path: Path to the audio file
+            mtime_local: File modification time (timezone-aware, local)
+            index: Index of events covering the file's tolerance window
+            window_start: Start of the file's own tolerance window; events that
+                ended before it are out of range
 
+        Returns:
+            Event dictionary if match found within tolerance, None otherwise,
+            or USER_CANCELLED if the user skipped interactive selection
+        """
+        mtime_ts = mtime_local.timestamp()
+        window_start_ts = window_start.timestamp()
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+
+        # Constraint: Event must start before the file modification time
+        # This ensures we're matching recordings to meetings that actually happened
+        cutoff = index.count_before(mtime_ts)
+        skipped = len(index.events) - cutoff
+        if debug and skipped:
+            self.logger.debug(
+                f"Filtered {skipped} events starting after {file_path.name} was modified"
+            )
+
+        # Handle interactive selection or automatic closest match
+        if self.select_event_interactively:
+            ends = index.ends
+            valid_events = [
+                (event, event["_local_start"], event["_local_end"])
+                for i, event in enumerate(index.events[:cutoff])
+                if ends[i] > window_start_ts
+            ]
             if not valid_events:
                 self.logger.debug(
                     f"No valid events found in window for {file_path.name}"
                 )
                 return None
 
-            # Handle interactive selection or automatic closest match
-            if self.select_event_interactively:
-                self.logger.debug(
-                    f"Interactive selection enabled for {file_path.name} - {len(valid_events)} valid events found"
-                )
-                selected_event = self._interactive_event_selection(
-                    valid_events, file_path
+            self.logger.debug(
+                f"Interactive selection enabled for {file_path.name} - {len(valid_events)} valid events found"
+            )
+            selected_event = self._interactive_event_selection(
+                valid_events, file_path
+            )
+            if selected_event and selected_event is not self.USER_CANCELLED:
+                # Copy so files matched to the same prefetched event don't share annotations
+                selected_event = dict(selected_event)
+                # Annotate selected event with distance (local times already set);
+                # every candidate started before the file, so only its end matters
+                selected_event["_distance_sec"] = max(
+                    0.0, mtime_ts - selected_event["_local_end"].timestamp()
                 )
-                if selected_event:
-                    # Annotate selected event with computed local times and distance
-                    event_start, event_end = self._parse_event_times(selected_event)
-                    distance_sec = self._calculate_distance_seconds(
-                        mtime_local, event_start, event_end
-                    )
-
-                    selected_event["_local_start"] = event_start
-                    selected_event["_local_end"] = event_end
-                    selected_event["_distance_sec"] = distance_sec
 
-                    event_title = selected_event.get("summary", "Unknown Event")
-                    self.logger.info(
-                        f"User selected event '{event_title}' for {file_path.name}"
-                    )
-                    return selected_event
-                else:
-                    self.logger.info(
-                        f"User cancelled event selection for {file_path.name}"
-                    )
-                    return self.USER_CANCELLED
-            else:
-                # Find closest event (original behavior)
-                closest_event = None
-                min_distance_sec = float("inf")
-
-                for event, event_start, event_end in valid_events:
-                    # Calculate distance from file mtime to event
-                    distance_sec = self._calculate_distance_seconds(
-                        mtime_local, event_start, event_end
-                    )
-
-                    if distance_sec < min_distance_sec:
-                        min_distance_sec = distance_sec
-                        closest_event = event
-
-            # Check if closest event is within tolerance
-            if closest_event:
-                # Annotate event with computed local times and distance
-                closest_event["_local_start"] = self._parse_event_times(closest_event)[
-                    0
-                ]
-                closest_event["_local_end"] = self._parse_event_times(closest_event)[1]
-                closest_event["_distance_sec"] = min_distance_sec
-
-                event_title = closest_event.get("summary", "Unknown Event")
+                event_title = selected_event.get("summary", "Unknown Event")
                 self.logger.info(
-                    f"Matched {file_path.name} to event '{event_title}' ({min_distance_sec/60:.1f} min away)"
+                    f"User selected event '{event_title}' for {file_path.name}"
                 )
-                return closest_event
+                return selected_event
             else:
-                self.logger.debug(
-                    f"No events within {self.cfg.match_tolerance_minutes} min tolerance for {file_path.name}"
+                self.logger.info(
+                    f"User cancelled event selection for {file_path.name}"
                 )
-                return None
+                return self.USER_CANCELLED
 
-        except GoogleCalendarError as e:
-            self.logger.warning(
-                f"Failed to match {file_path.name} to calendar event: {e}"
-            )
-            return None
-        except Exception as e:
-            self.logger.warning(f"Unexpected error matching {file_path.name}: {e}")
+        # Find closest event (original behavior) via the index
+        closest_idx = index.closest_before(mtime_ts, cutoff)
+
+        # The closest event ended last, so if it is outside the window all are
+        if closest_idx is None or index.ends[closest_idx] <= window_start_ts:
+            if debug:
+                self.logger.debug(
+                    f"No valid events found in window for {file_path.name}"
+                )
             return None
 
+        # Copy so files matched to the same prefetched event don't share annotations
+        closest_event = dict(index.events[closest_idx])
+        # The event started before the file, so it is either running or already over
+        min_distance_sec = max(0.0, mtime_ts - index.ends[closest_idx])
+        closest_event["_distance_sec"] = min_distance_sec
+
+        event_title = closest_event.get("summary", "Unknown Event")
+        self.logger.info(
+            f"Matched {file_path.name} to event '{event_title}' ({min_distance_sec/60:.1f} min away)"
+        )
+        return closest_event
+
     def compute_target_stem(self, event: Dict[str, Any]) -> str:
         """
         Compute the target filename stem for an event.
@@ -182,6 +461,10 @@ class CalendarLinker:
         Returns:
             Filename stem in format YYYY-MM-DD_Title
         """
+        cached = event.get("_target_stem")
+        if cached is not None:
+            return cached
+
         local_start = event.get("_local_start")
         if not local_start:
             return "unknown_date_untitled"
@@ -190,7 +473,9 @@ class CalendarLinker:
         title = event.get("summary", "Untitled Event")
         sanitized_title = sanitize_filename(title)
 
-        return f"{date_str}_{sanitized_title}"
+        stem = f"{date_str}_{sanitized_title}"
+        event["_target_stem"] = stem
+        return stem
 
     def format_event_metadata(self, event: Dict[str, Any], source_file: Path) -> str:
         """
@@ -203,160 +488,121 @@ class CalendarLinker:
         Returns:
             Markdown-formatted metadata block
         """
-        lines = []
-
-        # Header
-        lines.append("## Linked Calendar Event")
-        lines.append("")
-
-        # Title
-        title = event.get("summary", "Untitled Event")
-        lines.append(f"**Title:** {title}")
-
         # When (local times)
         local_start = event.get("_local_start")
         local_end = event.get("_local_end")
-        if local_start:
-            if event.get("start", {}).get("date"):  # All-day event
-                when_str = f"{local_start.strftime('%Y-%m-%d')} (all-day)"
-            else:
-                start_str = local_start.strftime("%Y-%m-%d %H:%M")
-                if local_end:
-                    end_str = local_end.strftime("%H:%M")
-                    when_str = f"{start_str} — {end_str}"
-                else:
-                    when_str = start_str
-            lines.append(f"**When:** {when_str}")
-        else:
-            lines.append("**When:** Unknown")
-
-        # Attendees
-        attendees = GoogleCalendarClient.extract_attendee_names(event)
-        if attendees:
-            if len(attendees) <= 5:
-                attendees_str = ", ".join(attendees)
-            else:
-                attendees_str = (
-                    ", ".join(attendees[:5]) + f" +{len(attendees) - 5} more"
-                )
-            lines.append(f"**Attendees:** {attendees_str}")
-        else:
-            lines.append("**Attendees:** None")
-
-        # Attachments
-        attachments = GoogleCalendarClient.extract_attachment_titles(event)
-        if attachments:
-            if len(attachments) <= 3:
-                attachments_str = ", ".join(attachments)
-            else:
-                attachments_str = (
-                    ", ".join(attachments[:3]) + f" +{len(attachments) - 3} more"
-                )
-            lines.append(f"**Attachments:** {attachments_str}")
+        if not local_start:
+            when_str = "Unknown"
+        elif event.get("start", {}).get("date"):  # All-day event
+            when_str = f"{local_start:%Y-%m-%d} (all-day)"
+        elif local_end:
+            when_str = f"{local_start:%Y-%m-%d %H:%M} — {local_end:%H:%M}"
         else:
-            lines.append("**Attachments:** None")
+            when_str = f"{local_start:%Y-%m-%d %H:%M}"
+
+        # Attendees (extracted once per event)
+        attendees = event.get("_attendees")
+        if attendees is None:
+            attendees = GoogleCalendarClient.extract_attendee_names(event)
+            event["_attendees"] = attendees
+
+        # Attachments (extracted once per event)
+        attachments = event.get("_attachments")
+        if attachments is None:
+            attachments = GoogleCalendarClient.extract_attachment_titles(event)
+            event["_attachments"] = attachments
+
+        lines = [
+            "## Linked Calendar Event",
+            "",
+            f"**Title:** {event.get('summary', 'Untitled Event')}",
+            f"**When:** {when_str}",
+            f"**Attendees:** {_summarize_names(attendees, 5)}",
+            f"**Attachments:** {_summarize_names(attachments, 3)}",
+        ]
 
         # Event URL
         html_link = event.get("htmlLink")
         if html_link:
             lines.append(f"**Event Link:** {html_link}")
 
-        # Source file
-        lines.append(f"**Source Audio:** {source_file.name}")
-
-        # Calendar ID
         calendar_id = event.get("organizer", {}).get("email", "primary")
+        lines.append(f"**Source Audio:** {source_file.name}")
         lines.append(f"**Calendar:** {calendar_id}")
 
         # Description (truncated)
         description = event.get("description", "").strip()
         if description:
-            if len(description) > 300:
-                description = description[:297] + "..."
-            lines.append("")
-            lines.append("**Description:**")
-            lines.append(description)
+            if len(description) > _DESCRIPTION_MAX_CHARS:
+                description = description[: _DESCRIPTION_MAX_CHARS - 3] + "..."
+            lines += ("", "**Description:**", description)
 
         return "\n".join(lines)
 
+    def _index_events(self, events: List[Dict[str, Any]]) -> _EventIndex:
+        """
+        Parse event times once and build a start-sorted index.
+
+        Events are annotated with their parsed local times by _parse_event_times
+        so they can be reused downstream. Events without a start are dropped.
+
+        Args:
+            events: Event dictionaries from Google Calendar API
+
+        Returns:
+            _EventIndex over the events with a known start time
+        """
+        parsed = []
+        for event in events:
+            event_start, event_end = self._parse_event_times(event)
+            if event_start is None:
+                continue
+            parsed.append((event_start, event_end, event))
+        return _EventIndex(parsed)
+
     def _parse_event_times(
         self, event: Dict[str, Any]
     ) -> tuple[Optional[datetime], Optional[datetime]]:
         """
         Parse event start and end times as local timezone-aware datetimes.
 
+        The parsed times are stored on the event as ``_local_start`` and
+        ``_local_end`` so later calls for the same event are free.
+
         Args:
             event: Event dictionary from Google Calendar API
 
         Returns:
             Tuple of (start_datetime, end_datetime), both timezone-aware in local tz
         """
+        if "_local_start" in event:
+            return event["_local_start"], event["_local_end"]
+
         start_info = event.get("start", {})
         end_info = event.get("end", {})
+        start_dt = end_dt = None
 
         # Handle all-day events
         if "date" in start_info:
             # All-day event
             date_str = start_info["date"]
-            start_dt = datetime.fromisoformat(date_str).replace(
-                tzinfo=datetime.now().astimezone().tzinfo
-            )
+            start_dt = datetime.fromisoformat(date_str).astimezone()
             end_date_str = end_info.get("date", date_str)
-            end_dt = datetime.fromisoformat(end_date_str).replace(
-                tzinfo=datetime.now().astimezone().tzinfo
-            )
-            return start_dt, end_dt
+            end_dt = datetime.fromisoformat(end_date_str).astimezone()
 
         # Handle timed events
-        if "dateTime" in start_info:
-            start_dt_str = start_info["dateTime"]
-            end_dt_str = end_info.get("dateTime", start_dt_str)
-
-            # Handle Python 3.10 compatibility by replacing Z with +00:00
-            if start_dt_str.endswith("Z"):
-                start_dt_str = start_dt_str[:-1] + "+00:00"
-            if end_dt_str.endswith("Z"):
-                end_dt_str = end_dt_str[:-1] + "+00:00"
-
-            start_dt = datetime.fromisoformat(start_dt_str)
-            end_dt = datetime.fromisoformat(end_dt_str)
-
-            # Convert to local timezone
-            local_tz = datetime.now().astimezone().tzinfo
-            start_dt = start_dt.astimezone(local_tz)
-            end_dt = end_dt.astimezone(local_tz)
-
-            return start_dt, end_dt
-
-        return None, None
-
-    def _calculate_distance_seconds(
-        self, file_time: datetime, event_start: datetime, event_end: Optional[datetime]
-    ) -> float:
-        """
-        Calculate the distance in seconds from file modification time to an event.
-
-        Args:
-            file_time: File modification time (timezone-aware)
-            event_start: Event start time (timezone-aware)
-            event_end: Event end time (timezone-aware), or None for instantaneous events
-
-        Returns:
-            Distance in seconds (0 if file_time is within event boundaries)
-        """
-        # If event has an end time and file_time is within the event
-        if event_end and event_start <= file_time <= event_end:
-            return 0.0
-
-        # If event is instantaneous (no end time) or file_time is before event
-        if file_time <= event_start:
-            return (event_start - file_time).total_seconds()
+        elif "dateTime" in start_info:
+            # Convert to local time, with the offset in effect at each instant
+            start_dt = _parse_iso_datetime(start_info["dateTime"]).astimezone()
+            end_dt_str = end_info.get("dateTime")
+            if end_dt_str:
+                end_dt = _parse_iso_datetime(end_dt_str).astimezone()
+            else:
+                end_dt = start_dt
 
-        # File_time is after event
-        if event_end:
-            return (file_time - event_end).total_seconds()
-        else:
-            return (file_time - event_start).total_seconds()
+        event["_local_start"] = start_dt
+        event["_local_end"] = end_dt
+        return start_dt, end_dt
 
     def _interactive_event_selection(
         self, valid_events: List[tuple], file_path: Path
@@ -1,5 +1,7 @@
 from pathlib import Path
 from typing import Dict, Optional, Set, Tuple, List
+import os
+import queue
 import time
 
 from app.core.config_models import AppConfig
@@ -7,6 +9,11 @@ from app.services.file_processor import FileProcessor
 from app.transcriber import Transcriber, SUPPORTED_EXTENSIONS
 
 
+# How often, in event mode, per-file state is reconciled with the folder contents
+# in case deletion events were missed (e.g. on observer queue overflow)
+_STATE_RECONCILE_INTERVAL_SECONDS = 3600.0
+
+
 class DirectoryWatcher:
     def __init__(
         self,
@@ -29,12 +36,96 @@ class DirectoryWatcher:
         self._processed: Set[Path] = set()
         self._skipped_large: Set[Path] = set()
 
-    def _list_audio_files(self, folder: Path) -> List[Path]:
+        # Filesystem events from the watchdog observer thread: (kind, path)
+        self._events: "queue.SimpleQueue[Tuple[str, Path]]" = queue.SimpleQueue()
+        self._pending: Set[Path] = set()
+
+    def _start_observer(self, folder: Path):
+        """Start a watchdog observer for the folder, or return None if watchdog is unavailable."""
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            return None
+
+        events = self._events
+
+        def _push(kind: str, raw_path) -> None:
+            if isinstance(raw_path, bytes):
+                raw_path = raw_path.decode()
+            path = Path(raw_path)
+            if path.suffix.lower() in SUPPORTED_EXTENSIONS:
+                events.put((kind, path))
+
+        class _AudioEventHandler(FileSystemEventHandler):
+            def on_created(self, event):
+                if not event.is_directory:
+                    _push("changed", event.src_path)
+
+            def on_modified(self, event):
+                if not event.is_directory:
+                    _push("changed", event.src_path)
+
+            def on_moved(self, event):
+                if not event.is_directory:
+                    _push("removed", event.src_path)
+                    _push("changed", event.dest_path)
+
+            def on_deleted(self, event):
+                if not event.is_directory:
+                    _push("removed", event.src_path)
+
+        observer = Observer()
+        try:
+            observer.schedule(_AudioEventHandler(), str(folder), recursive=False)
+            observer.start()
+        except OSError as e:
+            self.logger.warning(f"Could not start filesystem observer for {folder}, falling back to polling: {e}")
+            return None
+        return observer
+
+    def _forget(self, path: Path) -> None:
+        self._pending.discard(path)
+        self._size_state.pop(path, None)
+        self._processed.discard(path)
+        self._skipped_large.discard(path)
+
+    def _reconcile_state(self, folder: Path) -> None:
+        """Forget per-file state for files that are no longer in the folder."""
+        tracked = self._size_state.keys() | self._processed | self._skipped_large | self._pending
+        if not tracked:
+            return
         try:
-            return [
-                p for p in folder.iterdir()
-                if p.is_file() and p.suffix.lower() in SUPPORTED_EXTENSIONS
-            ]
+            with os.scandir(folder) as it:
+                present = {Path(entry.path) for entry in it}
+        except OSError as e:
+            # Keep the state rather than forget processed files and handle them again
+            self.logger.warning(f"Could not reconcile watcher state for {folder}: {e}")
+            return
+        for stale in tracked - present:
+            self._forget(stale)
+
+    def _drain_events(self) -> None:
+        while True:
+            try:
+                kind, path = self._events.get_nowait()
+            except queue.Empty:
+                return
+            if kind == "removed":
+                self._forget(path)
+            else:
+                self._pending.add(path)
+
+    def _list_audio_files(self, folder: Path) -> List[os.DirEntry]:
+        # DirEntry.is_file() uses the type from the directory listing, and DirEntry.stat()
+        # is cached, so each file costs one stat per poll
+        try:
+            with os.scandir(folder) as it:
+                return [
+                    entry for entry in it
+                    if os.path.splitext(entry.name)[1].lower() in SUPPORTED_EXTENSIONS
+                    and entry.is_file()
+                ]
         except FileNotFoundError:
             return []
         except (InterruptedError, OSError) as e:
@@ -55,16 +146,64 @@ class DirectoryWatcher:
         # unchanged
         return now_mono - last_change
 
-    def _is_file_created_after_watch_start(self, path: Path) -> bool:
+    def _is_file_created_after_watch_start(self, st: os.stat_result) -> bool:
         """Check if file was created after the watch started."""
+        # Use modification time as a proxy for creation time
+        # On most systems, modification time is set when file is created
+        return st.st_mtime > self._watch_start_time
+
+    def _check_candidate(
+        self,
+        path: Path,
+        now_mono: float,
+        entry: Optional[os.DirEntry] = None,
+        ready_mtimes: Optional[Dict[Path, float]] = None,
+    ) -> Optional[bool]:
+        """Check whether a file is ready for processing.
+
+        A single stat (reused from ``entry`` when given) serves both the
+        creation-time and the size checks. The modification time of a ready
+        file is recorded in ``ready_mtimes`` so later steps need not stat it.
+
+        Returns:
+            True if the file is stable and should be processed, False if it should be
+            checked again on the next tick, None if it can be ignored until it changes.
+        """
+        # Skip if already processed in this watcher session
+        if path in self._processed:
+            return None
+
         try:
-            # Use modification time as a proxy for creation time
-            # On most systems, modification time is set when file is created
-            file_mtime = path.stat().st_mtime
-            return file_mtime > self._watch_start_time
-        except (FileNotFoundError, OSError):
-            # If we can't get the file stats, assume it's new
-            return True
+            st = entry.stat() if entry is not None else path.stat()
+        except FileNotFoundError:
+            return None
+
+        # Skip files that were created before the watch started
+        if not self._is_file_created_after_watch_start(st):
+            return None
+
+        size = st.st_size
+
+        # Enforce max file size
+        if size > self.max_bytes:
+            if path not in self._skipped_large:
+                self.logger.warning(
+                    f"Skipping {path.name}: size {size/1024/1024:.1f} MB exceeds limit "
+                    f"{self.max_bytes/1024/1024:.0f} MB"
+                )
+                self._skipped_large.add(path)
+            return None
+
+        # Wait until file has been stable for configured seconds
+        stable_elapsed = self._update_size_state(path, size, now_mono)
+        if stable_elapsed < self.stable_seconds:
+            # still growing or within stability window
+            return False
+
+        self.logger.info(f"Detected stable file: {path.name} ({size/1024/1024:.1f} MB) - starting processing")
+        if ready_mtimes is not None:
+            ready_mtimes[path] = st.st_mtime
+        return True
 
     def watch(
         self,
@@ -96,70 +235,72 @@ class DirectoryWatcher:
             f"only_processing_files_created_after_watch_start"
         )
 
+        observer = self._start_observer(input_dir)
+        if observer is not None:
+            # One catch-up scan seeds files that were already being written when watching began;
+            # afterwards only paths reported by filesystem events are examined
+            self._pending.update(Path(entry.path) for entry in self._list_audio_files(input_dir))
+            self.logger.debug("Using filesystem events to detect new files")
+        else:
+            self.logger.debug("watchdog not installed; polling the folder for new files")
+
+        last_reconcile = time.monotonic()
         try:
             while True:
                 now_mono = time.monotonic()
-                current_files = self._list_audio_files(input_dir)
-
-                # Cleanup state for removed files
-                current_set = set(current_files)
-                for stale in list(self._size_state.keys()):
-                    if stale not in current_set:
-                        self._size_state.pop(stale, None)
-                        self._processed.discard(stale)
-                        self._skipped_large.discard(stale)
+                candidates: Dict[Path, Optional[os.DirEntry]]
+                if observer is not None:
+                    self._drain_events()
+                    if now_mono - last_reconcile >= _STATE_RECONCILE_INTERVAL_SECONDS:
+                        self._reconcile_state(input_dir)
+                        last_reconcile = now_mono
+                    candidates = dict.fromkeys(self._pending)
+                else:
+                    candidates = {
+                        Path(entry.path): entry for entry in self._list_audio_files(input_dir)
+                    }
 
-                for path in current_files:
-                    # Skip if already processed in this watcher session
-                    if path in self._processed:
-                        continue
+                    # Cleanup state for removed files
+                    for stale in self._size_state.keys() - candidates.keys():
+                        self._forget(stale)
 
-                    # Skip files that were created before the watch started
-                    if not self._is_file_created_after_watch_start(path):
-                        continue
+                stable_files = []
+                stable_mtimes: Dict[Path, float] = {}
+                for path, entry in candidates.items():
+                    ready = self._check_candidate(path, now_mono, entry, stable_mtimes)
+                    if ready is None:
+                        # Nothing more to wait for until the next event for this path
+                        self._pending.discard(path)
+                    elif ready:
+                        self._pending.discard(path)
+                        stable_files.append(path)
 
+                # Process every file that became stable in this tick as one batch,
+                # so calendar events for overlapping windows are fetched once
+                if stable_files:
+                    names = ", ".join(p.name for p in stable_files)
                     try:
-                        size = path.stat().st_size
-                    except FileNotFoundError:
-                        continue
-
-                    # Enforce max file size
-                    if size > self.max_bytes:
-                        if path not in self._skipped_large:
-                            self.logger.warning(
-                                f"Skipping {path.name}: size {size/1024/1024:.1f} MB exceeds limit "
-                                f"{self.max_bytes/1024/1024:.0f} MB"
-                            )
-                            self._skipped_large.add(path)
-                        continue
-
-                    # Wait until file has been stable for configured seconds
-                    stable_elapsed = self._update_size_state(path, size, now_mono)
-                    if stable_elapsed < self.stable_seconds:
-                        # still growing or within stability window
-                        continue
-
-                    # File is stable - trigger processing
-                    try:
-                        self.logger.info(f"Detected stable file: {path.name} ({size/1024/1024:.1f} MB) - starting processing")
                         processed_count, skipped_count = processor.run_batch(
-                            [path], effective_reprocess, transcriber, output_folder,
+                            stable_files, effective_reprocess, transcriber, output_folder,
                             llm_generator, llm_modes, calendar_linker,
                             trim_silence=trim_silence,
                             min_silence_len=min_silence_len,
                             silence_thresh=silence_thresh,
                             keep_silence=keep_silence,
+                            mtimes=stable_mtimes,
                         )
-                        # Mark as processed regardless of processed/skipped to avoid repeated attempts
-                        self._processed.add(path)
                         self.logger.info(
-                            f"Completed handling {path.name}: processed={processed_count}, skipped={skipped_count}"
+                            f"Completed handling {names}: processed={processed_count}, skipped={skipped_count}"
                         )
                     except Exception as e:
-                        self.logger.error(f"Failed to handle {path.name}: {e}")
-                        # Avoid tight loop reprocessing on error; mark as processed to prevent hammering
-                        self._processed.add(path)
+                        self.logger.error(f"Failed to handle {names}: {e}")
+                    # Mark as processed regardless of outcome to avoid repeated attempts
+                    self._processed.update(stable_files)
 
                 time.sleep(self.poll_interval)
         except KeyboardInterrupt:
             self.logger.info("Directory watcher stopped by user (Ctrl+C)")
+        finally:
+            if observer is not None:
+                observer.stop()
+                observer.join()
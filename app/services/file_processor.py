@@ -5,9 +5,14 @@ This module provides functionality for discovering, filtering, and processing
 audio files, including batch operations and output file management.
 """
 
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
+import logging
+import os
+import shutil
 import tempfile
+import threading
 
 from app.core.config_models import AppConfig
 from app.core.utils import ensure_directory_exists, generate_unique_path
@@ -15,6 +20,35 @@ from app.transcriber import SUPPORTED_EXTENSIONS, Transcriber
 from app.services.audio_tools import remove_silence
 
 
+class _DeferredNotes:
+    """
+    Stand-in for LLMNotesGenerator that queues note requests during a batch.
+
+    run_batch hands it to the per-file workers so every transcription finishes
+    first; the queued requests are then sent together through
+    LLMNotesGenerator.generate_for_files.
+    """
+
+    def __init__(self):
+        self.jobs: List[Tuple] = []
+        self._lock = threading.Lock()
+
+    def generate_for_modes(
+        self,
+        content: str,
+        modes: Set[str],
+        file_stem: str,
+        base_output: Path,
+        reprocess: bool,
+        existing_outputs: Optional[Set[str]] = None,
+    ) -> Dict[str, Path]:
+        with self._lock:
+            self.jobs.append(
+                (content, frozenset(modes), file_stem, base_output, reprocess, existing_outputs)
+            )
+        return {}
+
+
 class FileProcessor:
     """
     Service for processing audio files and managing file operations.
@@ -67,13 +101,69 @@ class FileProcessor:
         if not input_dir.is_dir():
             raise ValueError(f"Input path is not a directory: {input_dir}")
 
-        files = [
-            p
-            for p in input_dir.iterdir()
-            if p.is_file() and p.suffix.lower() in SUPPORTED_EXTENSIONS
+        # DirEntry caches the file type and stat result, so each file costs at most one stat
+        entries = []
+        with os.scandir(input_dir) as it:
+            for entry in it:
+                if (
+                    os.path.splitext(entry.name)[1].lower() in SUPPORTED_EXTENSIONS
+                    and entry.is_file()
+                ):
+                    entries.append((entry.stat().st_mtime, entry.path))
+        entries.sort(key=lambda item: item[0], reverse=True)
+        return [Path(path) for _, path in entries]
+
+    def _existing_outputs(self, output_folder: Path) -> Set[str]:
+        """
+        List the stems of transcription outputs already present in the output folder.
+
+        Args:
+            output_folder: Output folder path
+
+        Returns:
+            Set of stems that already have an output file
+        """
+        ext = self._output_ext()
+        try:
+            with os.scandir(output_folder) as it:
+                return {
+                    entry.name[: -len(ext)]
+                    for entry in it
+                    if entry.name.endswith(ext) and entry.is_file()
+                }
+        except FileNotFoundError:
+            return set()
+
+    def _output_ext(self) -> str:
+        """Return the configured transcription output extension with its leading dot."""
+        return f".{self.cfg.paths.output_extension.lstrip('.')}"
+
+    def _plan_batch(
+        self,
+        files: List[Path],
+        reprocess: bool,
+        output_folder: Path,
+        existing: Optional[Set[str]] = None,
+    ) -> List[Tuple[Path, Path, bool]]:
+        """
+        Pair each file with its default output path and whether it needs work.
+
+        Args:
+            files: List of candidate audio files
+            reprocess: Whether to reprocess files that already have outputs
+            output_folder: Output folder path
+            existing: Stems of existing outputs, scanned from the folder if None
+
+        Returns:
+            List of (file, default_output_path, needs_work) tuples
+        """
+        ext = self._output_ext()
+        if existing is None and not reprocess:
+            existing = self._existing_outputs(output_folder)
+        return [
+            (file, output_folder / f"{file.stem}{ext}", reprocess or file.stem not in existing)
+            for file in files
         ]
-        files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-        return files
 
     def get_files_to_process(
         self, files: List[Path], reprocess: bool, output_folder: Path
@@ -90,11 +180,11 @@ class FileProcessor:
             List of files that should be processed
         """
         candidates = []
-        for file in files:
-            ext = f".{self.cfg.paths.output_extension.lstrip('.')}"
-            out = output_folder / f"{file.stem}{ext}"
-            if not reprocess and out.exists():
-                self.logger.debug(f"Skipping {file.name}: output already exists")
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        for file, _, needs_work in self._plan_batch(files, reprocess, output_folder):
+            if not needs_work:
+                if debug:
+                    self.logger.debug(f"Skipping {file.name}: output already exists")
                 continue
             candidates.append(file)
         return candidates
@@ -136,6 +226,7 @@ class FileProcessor:
         min_silence_len: int = 1000,
         silence_thresh: int = -40,
         keep_silence: int = 100,
+        mtimes: Optional[Dict[Path, float]] = None,
     ) -> Tuple[int, int]:
         """
         Process a batch of audio files with optional LLM note generation and calendar linking.
@@ -150,6 +241,8 @@ class FileProcessor:
                 - set[str]: Global modes for all files (backward compatibility)
                 - dict[Path, set[str]]: Per-file modes for interactive selection
             calendar_linker: Optional CalendarLinker instance for calendar integration
+            mtimes: Optional modification times already read by the caller, keyed
+                by path, so calendar matching doesn't stat the files again
 
         Returns:
             Tuple of (processed_count, skipped_count)
@@ -157,7 +250,7 @@ class FileProcessor:
         processed = skipped = 0
 
         # Debug logging for modes
-        if llm_modes:
+        if llm_modes and self.logger.isEnabledFor(logging.DEBUG):
             if isinstance(llm_modes, dict):
                 self.logger.debug(
                     f"Processing with per-file modes for {len(llm_modes)} files"
@@ -167,10 +260,29 @@ class FileProcessor:
                     f"Processing with global modes: {''.join(sorted(llm_modes))}"
                 )
 
-        for file in files:
+        # Canonicalize modes once so the LLM generator needn't per file
+        if isinstance(llm_modes, dict):
+            llm_modes = self._resolve_modes_by_file(files, llm_modes)
+        elif isinstance(llm_modes, (set, frozenset)):
+            llm_modes = frozenset(m.upper() for m in llm_modes)
+
+        # Match all files to calendar events up front so overlapping windows share one fetch
+        matched_events = calendar_linker.match_files(files, mtimes) if calendar_linker else {}
+
+        # Resolve output paths sequentially so concurrent workers never pick the same path
+        jobs = []
+        reserved: Set[Path] = set()
+        existing = self._existing_outputs(output_folder)
+        for file, default_out, _ in self._plan_batch(files, reprocess, output_folder, existing):
             # Determine target output path and metadata block
             target_out, metadata_block, original_out = self._determine_output_paths(
-                file, output_folder, calendar_linker
+                file,
+                output_folder,
+                calendar_linker,
+                matched_events.get(file),
+                reserved,
+                existing,
+                default_out,
             )
 
             # If calendar linking is enabled and user cancelled selection, skip this file
@@ -181,223 +293,443 @@ class FileProcessor:
                 skipped += 1
                 continue
 
-            target_stem = target_out.stem
-
-            # Debug logging for per-file modes
-            if llm_modes and isinstance(llm_modes, dict):
-                file_modes_debug = self._get_modes_for_file(file, llm_modes)
-                self.logger.debug(f"PROC {file.name} modes: {file_modes_debug}")
-
-            # Check if target transcription already exists
-            transcription_exists = target_out.exists()
-
-            if transcription_exists and not reprocess:
-                # Smart processing: transcription exists and we're not reprocessing
-                handled, proc_inc, skip_inc = self._handle_existing_without_reprocess(
-                    file,
-                    target_out,
-                    target_stem,
-                    llm_generator,
-                    llm_modes,
-                    output_folder,
-                )
-                if handled:
-                    processed += proc_inc
-                    skipped += skip_inc
-                    continue
-            elif transcription_exists and reprocess:
-                # Reprocessing: read existing transcription and regenerate LLM notes only
-                self.logger.info(
-                    f"Reprocessing {file.name} using existing transcription, regenerating LLM notes"
-                )
+            reserved.add(target_out)
+            jobs.append((file, target_out, metadata_block, original_out))
+
+        # With several files, queue LLM requests and send them together once all
+        # transcriptions are done instead of waiting on the LLM file by file
+        deferred = _DeferredNotes() if llm_generator and llm_modes and len(jobs) > 1 else None
+        # List the Q/W/E folders once so note-exists checks are set lookups
+        existing_notes = (
+            llm_generator.list_existing_notes(output_folder)
+            if llm_generator and llm_modes and jobs and not reprocess
+            else None
+        )
+        notes_generator = deferred or llm_generator
+
+        def process_job(job, audio_executor=None):
+            return self._process_file(
+                *job,
+                reprocess,
+                transcriber,
+                output_folder,
+                notes_generator,
+                llm_modes,
+                trim_silence,
+                min_silence_len,
+                silence_thresh,
+                keep_silence,
+                existing,
+                audio_executor,
+                existing_notes,
+            )
 
-                try:
-                    # Read existing transcription
-                    existing_content = target_out.read_text()
-                    self.logger.info(
-                        f"Loaded existing transcription for {file.name} ({len(existing_content)} chars)"
-                    )
+        workers = min(max(1, int(self.cfg.processing.batch_concurrency)), len(jobs))
+        if workers <= 1:
+            for job in jobs:
+                proc_inc, skip_inc = process_job(job)
+                processed += proc_inc
+                skipped += skip_inc
+        else:
+            self.logger.debug(f"Processing {len(jobs)} files with {workers} workers")
+            # Silence trimming is CPU-bound Python, so the worker threads hand it to
+            # separate processes instead of contending for the GIL
+            audio_executor = (
+                ProcessPoolExecutor(max_workers=min(workers, os.cpu_count() or 1))
+                if trim_silence
+                else None
+            )
+            try:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = [executor.submit(process_job, job, audio_executor) for job in jobs]
+                    try:
+                        for future in as_completed(futures):
+                            proc_inc, skip_inc = future.result()
+                            processed += proc_inc
+                            skipped += skip_inc
+                    except KeyboardInterrupt:
+                        # Drop queued files; let in-flight ones finish writing
+                        for future in futures:
+                            future.cancel()
+                        raise
+            finally:
+                if audio_executor is not None:
+                    audio_executor.shutdown(cancel_futures=True)
+
+        if deferred and deferred.jobs:
+            self.logger.info(f"Generating LLM notes for {len(deferred.jobs)} files")
+            llm_generator.generate_for_files(deferred.jobs)
 
-                    # Generate LLM notes if requested
-                    if llm_generator and llm_modes:
-                        file_modes = self._get_modes_for_file(file, llm_modes)
-                        if file_modes:
-                            llm_generator.generate_for_modes(
-                                existing_content,
-                                file_modes,
-                                target_stem,
-                                output_folder,
-                                reprocess,
-                            )
-                            self.logger.info(f"LLM notes regenerated for {file.name}")
-                        else:
-                            self.logger.info(
-                                f"No LLM modes specified for {file.name}, skipping LLM generation"
-                            )
-                    else:
-                        self.logger.info(
-                            f"No LLM setup for {file.name}, skipping LLM generation"
-                        )
+        return processed, skipped
 
-                    processed += 1
+    def _process_file(
+        self,
+        file: Path,
+        target_out: Path,
+        metadata_block: Optional[str],
+        original_out: Optional[Path],
+        reprocess: bool,
+        transcriber: Transcriber,
+        output_folder: Path,
+        llm_generator,
+        llm_modes,
+        trim_silence: bool,
+        min_silence_len: int,
+        silence_thresh: int,
+        keep_silence: int,
+        existing_outputs: Optional[Set[str]] = None,
+        audio_executor: Optional[Executor] = None,
+        existing_notes: Optional[Set[str]] = None,
+    ) -> Tuple[int, int]:
+        """
+        Transcribe a single file (or reuse its transcription) and generate LLM notes.
 
-                except Exception as e:
-                    self.logger.error(f"Failed to reprocess {file.name}: {e}")
-                    processed += 1  # Still count as processed even if it fails
+        Safe to run concurrently for different files: output paths are resolved
+        beforehand by run_batch.
 
-                continue
+        Args:
+            file: The audio file being processed
+            target_out: The target output path for transcription
+            metadata_block: Optional calendar metadata block to prepend
+            original_out: Output path under the default naming, used for migration
+            reprocess: Whether to reprocess existing files
+            transcriber: Transcriber instance
+            output_folder: Output folder path
+            llm_generator: Optional LLMNotesGenerator instance
+            llm_modes: Optional modes configuration (see run_batch)
+            trim_silence: Whether to trim silence before transcription
+            min_silence_len: Minimum silence length in milliseconds
+            silence_thresh: Silence threshold in dBFS
+            keep_silence: Amount of silence to keep around segments in milliseconds
+            existing_outputs: Stems of outputs present when the batch started, as
+                returned by _existing_outputs; the filesystem is checked if None
+            audio_executor: Optional process pool to run silence trimming in
+            existing_notes: Names of LLM notes present when the batch started, as
+                returned by LLMNotesGenerator.list_existing_notes
+
+        Returns:
+            Tuple of (processed_increment, skipped_increment)
+        """
+        target_stem = target_out.stem
+
+        # Debug logging for per-file modes
+        if (
+            llm_modes
+            and isinstance(llm_modes, dict)
+            and self.logger.isEnabledFor(logging.DEBUG)
+        ):
+            file_modes_debug = self._get_modes_for_file(file, llm_modes)
+            self.logger.debug(f"PROC {file.name} modes: {file_modes_debug}")
+
+        def output_exists(out: Path) -> bool:
+            if existing_outputs is None:
+                return out.exists()
+            return out.stem in existing_outputs
+
+        # Check if target transcription already exists
+        transcription_exists = output_exists(target_out)
+
+        if transcription_exists and not reprocess:
+            # Smart processing: transcription exists and we're not reprocessing
+            handled, proc_inc, skip_inc = self._handle_existing_without_reprocess(
+                file,
+                target_out,
+                target_stem,
+                llm_generator,
+                llm_modes,
+                output_folder,
+                existing_notes,
+            )
+            if handled:
+                return proc_inc, skip_inc
+        elif transcription_exists and reprocess:
+            # Reprocessing: read existing transcription and regenerate LLM notes only
+            self.logger.info(
+                f"Reprocessing {file.name} using existing transcription, regenerating LLM notes"
+            )
 
-            # Handle migration from old naming to new naming
-            migrated = False
-            if (
-                not transcription_exists
-                and original_out
-                and original_out.exists()
-                and not reprocess
-            ):
+            try:
+                # Read existing transcription
+                existing_content = target_out.read_text(encoding="utf-8")
                 self.logger.info(
-                    f"Migrating existing transcription from {original_out.name} to {target_out.name}"
+                    f"Loaded existing transcription for {file.name} ({len(existing_content)} chars)"
                 )
-                try:
-                    existing_content = original_out.read_text()
 
-                    # Prepend metadata block if calendar linking was successful
-                    if metadata_block and not existing_content.startswith(
-                        "## Linked Calendar Event"
-                    ):
-                        full_content = metadata_block + "\n\n" + existing_content
+                # Generate LLM notes if requested
+                if llm_generator and llm_modes:
+                    file_modes = self._get_modes_for_file(file, llm_modes)
+                    if file_modes:
+                        llm_generator.generate_for_modes(
+                            existing_content,
+                            file_modes,
+                            target_stem,
+                            output_folder,
+                            reprocess,
+                            existing_outputs=existing_notes,
+                        )
+                        self.logger.info(f"LLM notes requested for {file.name}")
                     else:
-                        full_content = existing_content
-
-                    # Write to new location
-                    with open(target_out, "w") as fp:
-                        fp.write(full_content)
-
-                    # Generate LLM notes if requested
-                    if llm_generator and llm_modes:
-                        try:
-                            file_modes = self._get_modes_for_file(file, llm_modes)
-                            self.logger.debug(
-                                f"Generating LLM for {file.name} with modes: {file_modes}"
-                            )
-                            if file_modes:
-                                llm_generator.generate_for_modes(
-                                    full_content,
-                                    file_modes,
-                                    target_stem,
-                                    output_folder,
-                                    reprocess,
-                                )
-                                self.logger.info(
-                                    f"LLM notes generated for migrated {file.name}"
-                                )
-                            else:
-                                self.logger.info(
-                                    f"No LLM modes specified for {file.name}, skipping LLM generation"
-                                )
-                        except Exception as e:
-                            self.logger.error(
-                                f"Failed to generate LLM notes for migrated {file.name}: {e}"
-                            )
-
-                    processed += 1
-                    migrated = True
-
-                except Exception as e:
-                    self.logger.error(f"Failed to migrate {file.name}: {e}")
-                    processed += 1  # Still count as processed even if migration fails
-
-            if migrated:
-                continue
-
-            # Transcription doesn't exist, process the file normally
-            try:
-                # Preprocess audio if silence trimming is enabled
-                src_path, temp_path = self._preprocess_audio(file, trim_silence, min_silence_len, silence_thresh, keep_silence)
-
-                # Process the audio file (original or preprocessed)
-                try:
-                    notes = transcriber.process_audio_file(src_path)
-                finally:
-                    # Clean up temporary file if it was created
-                    if temp_path and temp_path.exists():
-                        try:
-                            temp_path.unlink()
-                            self.logger.debug(f"Cleaned up temporary file: {temp_path}")
-                        except Exception as cleanup_error:
-                            self.logger.warning(f"Failed to clean up temporary file {temp_path}: {cleanup_error}")
-
-                # Prepend metadata block if calendar linking was successful
-                if metadata_block:
-                    full_notes = metadata_block + "\n\n" + notes
+                        self.logger.info(
+                            f"No LLM modes specified for {file.name}, skipping LLM generation"
+                        )
                 else:
-                    full_notes = notes
+                    self.logger.info(
+                        f"No LLM setup for {file.name}, skipping LLM generation"
+                    )
 
-                with open(target_out, "w") as fp:
-                    fp.write(full_notes)
-                self.logger.info(f"Transcription completed and saved to {target_out}")
+            except Exception as e:
+                self.logger.error(f"Failed to reprocess {file.name}: {e}")
+
+            return 1, 0  # Still count as processed even if it fails
+
+        # Handle migration from old naming to new naming
+        migrated = False
+        if (
+            not transcription_exists
+            and original_out
+            and output_exists(original_out)
+            and not reprocess
+        ):
+            self.logger.info(
+                f"Migrating existing transcription from {original_out.name} to {target_out.name}"
+            )
+            try:
+                # Copy to new location, prepending the calendar metadata block
+                if not self._migrate_output(
+                    original_out, target_out, metadata_block, existing_outputs
+                ):
+                    return 0, 1
 
                 # Generate LLM notes if requested
                 if llm_generator and llm_modes:
                     try:
-                        # Get modes for this specific file
                         file_modes = self._get_modes_for_file(file, llm_modes)
-                        self.logger.debug(
-                            f"Generating LLM for {file.name} with modes: {file_modes}"
-                        )
+                        if self.logger.isEnabledFor(logging.DEBUG):
+                            self.logger.debug(
+                                f"Generating LLM for {file.name} with modes: {file_modes}"
+                            )
                         if file_modes:
                             llm_generator.generate_for_modes(
-                                full_notes,
+                                target_out.read_text(encoding="utf-8"),
                                 file_modes,
                                 target_stem,
                                 output_folder,
                                 reprocess,
+                                existing_outputs=existing_notes,
+                            )
+                            self.logger.info(
+                                f"LLM notes requested for migrated {file.name}"
                             )
-                            self.logger.info(f"LLM notes generated for {file.name}")
                         else:
                             self.logger.info(
                                 f"No LLM modes specified for {file.name}, skipping LLM generation"
                             )
                     except Exception as e:
                         self.logger.error(
-                            f"Failed to generate LLM notes for {file.name}: {e}"
+                            f"Failed to generate LLM notes for migrated {file.name}: {e}"
                         )
 
-                processed += 1
+                migrated = True
+
             except Exception as e:
-                self.logger.error(f"Failed to process {file}: {e}")
-                notes = f"Error: Could not process {file}."
+                self.logger.error(f"Failed to migrate {file.name}: {e}")
 
-                # Prepend metadata block even for errors if calendar linking was successful
-                if metadata_block:
-                    full_notes = metadata_block + "\n\n" + notes
-                else:
-                    full_notes = notes
+        if migrated:
+            return 1, 0
 
-                with open(target_out, "w") as fp:
-                    fp.write(full_notes)
+        # Transcription doesn't exist, process the file normally
+        try:
+            # Preprocess audio if silence trimming is enabled
+            src_path, temp_path = self._preprocess_audio(
+                file, trim_silence, min_silence_len, silence_thresh, keep_silence, audio_executor
+            )
 
-                # Even for errors, try to generate LLM notes if requested (from error message)
-                if llm_generator and llm_modes:
+            # Process the audio file (original or preprocessed)
+            try:
+                notes = transcriber.process_audio_file(src_path)
+            finally:
+                # Clean up temporary file if it was created
+                if temp_path and temp_path.exists():
                     try:
-                        # Get modes for this specific file
-                        file_modes = self._get_modes_for_file(file, llm_modes)
-                        if file_modes:
-                            llm_generator.generate_for_modes(
-                                full_notes,
-                                file_modes,
-                                target_stem,
-                                output_folder,
-                                reprocess,
-                            )
-                    except Exception as llm_error:
-                        self.logger.error(
-                            f"Failed to generate LLM notes for error case {file.name}: {llm_error}"
+                        temp_path.unlink()
+                        self.logger.debug(f"Cleaned up temporary file: {temp_path}")
+                    except Exception as cleanup_error:
+                        self.logger.warning(f"Failed to clean up temporary file {temp_path}: {cleanup_error}")
+
+            # Prepend metadata block if calendar linking was successful
+            if metadata_block:
+                full_notes = metadata_block + "\n\n" + notes
+            else:
+                full_notes = notes
+
+            if not self._write_output(target_out, full_notes, reprocess, existing_outputs):
+                return 0, 1
+
+            # Generate LLM notes if requested. The save and the LLM plan share one
+            # log record, emitted before the request so the order reads naturally
+            if llm_generator and llm_modes:
+                try:
+                    # Get modes for this specific file
+                    file_modes = self._get_modes_for_file(file, llm_modes)
+                    if file_modes:
+                        self.logger.info(
+                            f"Transcription completed and saved to {target_out}; "
+                            f"requesting LLM notes ({''.join(sorted(file_modes))})"
+                        )
+                        llm_generator.generate_for_modes(
+                            full_notes,
+                            file_modes,
+                            target_stem,
+                            output_folder,
+                            reprocess,
+                            existing_outputs=existing_notes,
+                        )
+                    else:
+                        self.logger.info(
+                            f"Transcription completed and saved to {target_out}; "
+                            f"no LLM modes specified, skipping LLM generation"
                         )
+                except Exception as e:
+                    self.logger.error(
+                        f"Failed to generate LLM notes for {file.name}: {e}"
+                    )
+            else:
+                self.logger.info(f"Transcription completed and saved to {target_out}")
 
-                processed += 1  # Still count as processed (error file created)
+        except Exception as e:
+            self.logger.error(f"Failed to process {file}: {e}")
+            notes = f"Error: Could not process {file}."
 
-        return processed, skipped
+            # Prepend metadata block even for errors if calendar linking was successful
+            if metadata_block:
+                full_notes = metadata_block + "\n\n" + notes
+            else:
+                full_notes = notes
+
+            if not self._write_output(target_out, full_notes, reprocess, existing_outputs):
+                return 0, 1
+
+            # Even for errors, try to generate LLM notes if requested (from error message)
+            if llm_generator and llm_modes:
+                try:
+                    # Get modes for this specific file
+                    file_modes = self._get_modes_for_file(file, llm_modes)
+                    if file_modes:
+                        llm_generator.generate_for_modes(
+                            full_notes,
+                            file_modes,
+                            target_stem,
+                            output_folder,
+                            reprocess,
+                            existing_outputs=existing_notes,
+                        )
+                except Exception as llm_error:
+                    self.logger.error(
+                        f"Failed to generate LLM notes for error case {file.name}: {llm_error}"
+                    )
+
+        return 1, 0  # Counted as processed even on error (error file created)
+
+    def _write_output(
+        self,
+        path: Path,
+        content: str,
+        reprocess: bool,
+        existing_outputs: Optional[Set[str]] = None,
+    ) -> bool:
+        """
+        Write a transcription output file.
+
+        Unless reprocessing, the file is created exclusively so an output that
+        appeared after the batch started (e.g. from another run) is never overwritten.
+
+        Args:
+            path: Output file path
+            content: Text to write
+            reprocess: Whether existing outputs may be overwritten
+            existing_outputs: Batch set of existing output stems, updated on success
+                so later files in the batch see this output
+
+        Returns:
+            True if the file was written, False if it already existed
+        """
+        try:
+            # Encode once and write the bytes directly, skipping the text IO layer
+            with open(path, "wb" if reprocess else "xb") as fp:
+                fp.write(content.encode("utf-8"))
+        except FileExistsError:
+            self.logger.warning(f"Skipping {path.name}: output was created by another process")
+            return False
+        if existing_outputs is not None:
+            existing_outputs.add(path.stem)
+        return True
+
+    def _migrate_output(
+        self,
+        original_out: Path,
+        target_out: Path,
+        metadata_block: Optional[str],
+        existing_outputs: Optional[Set[str]] = None,
+    ) -> bool:
+        """
+        Copy a transcription saved under the default name to its linked name.
+
+        The metadata block is written first and the original body streamed after
+        it, so the transcript is never held in memory. The original is left in
+        place and the target is never overwritten.
+
+        Args:
+            original_out: Existing output under the default naming
+            target_out: Output path under the calendar-linked naming
+            metadata_block: Optional calendar metadata block to prepend
+            existing_outputs: Batch set of existing output stems, updated on success
+
+        Returns:
+            True if the output was migrated, False if the target already existed
+        """
+        marker = b"## Linked Calendar Event"
+        try:
+            with open(original_out, "rb") as src, open(target_out, "xb") as dst:
+                # Skip the block if the transcription was already linked
+                if metadata_block and src.read(len(marker)) != marker:
+                    dst.write(f"{metadata_block}\n\n".encode("utf-8"))
+                src.seek(0)
+                shutil.copyfileobj(src, dst, 64 * 1024)
+        except FileExistsError:
+            self.logger.warning(
+                f"Skipping {target_out.name}: output was created by another process"
+            )
+            return False
+        if existing_outputs is not None:
+            existing_outputs.add(target_out.stem)
+        return True
+
+    def _resolve_modes_by_file(self, files: List[Path], llm_modes: dict) -> dict:
+        """
+        Key per-file modes by the batch's own paths.
+
+        Selections may use differently spelled paths for the same files, which
+        _get_modes_for_file would otherwise match by scanning every entry for
+        each file. Resolving them once here, through a name index, makes every
+        later lookup an exact match.
+
+        Args:
+            files: Files in the batch
+            llm_modes: Per-file modes as given to run_batch
+
+        Returns:
+            Dictionary mapping batch paths to frozensets of uppercase modes; files
+            without modes are omitted
+        """
+        by_name = {p.name: modes for p, modes in llm_modes.items()}
+        resolved = {}
+        for file in files:
+            modes = llm_modes.get(file)
+            if modes is None:
+                modes = by_name.get(file.name)
+            if modes is not None:
+                resolved[file] = frozenset(m.upper() for m in modes)
+        return resolved
 
     def _get_modes_for_file(self, file: Path, llm_modes):
         """
@@ -416,36 +748,47 @@ class FileProcessor:
         # Handle per-file modes (dict format)
         if isinstance(llm_modes, dict):
             # First try exact match
-            if file in llm_modes:
-                self.logger.debug(
-                    f"Found exact match for {file.name} with modes: {''.join(sorted(llm_modes[file]))}"
-                )
-                return llm_modes[file]
+            modes = llm_modes.get(file)
+            if modes is not None:
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(
+                        f"Found exact match for {file.name} with modes: {''.join(sorted(modes))}"
+                    )
+                return modes
 
             # Try to find by filename match (more robust)
             file_name = file.name
             for dict_file, modes in llm_modes.items():
                 if dict_file.name == file_name:
-                    self.logger.debug(
-                        f"Found filename match for {file_name} with modes: {''.join(sorted(modes))}"
-                    )
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug(
+                            f"Found filename match for {file_name} with modes: {''.join(sorted(modes))}"
+                        )
                     return modes
 
             # If still not found, log the issue
-            self.logger.debug(
-                f"No modes found for {file_name}. Available files: {[f.name for f in llm_modes.keys()]}"
-            )
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    f"No modes found for {file_name}. Available files: {[f.name for f in llm_modes.keys()]}"
+                )
             return set()
 
         # Handle global modes (set format) for backward compatibility
-        if isinstance(llm_modes, set):
+        if isinstance(llm_modes, (set, frozenset)):
             return llm_modes
 
         # Fallback
         return set()
 
     def _determine_output_paths(
-        self, file: Path, output_folder: Path, calendar_linker
+        self,
+        file: Path,
+        output_folder: Path,
+        calendar_linker,
+        matched_event=None,
+        reserved: Optional[Set[Path]] = None,
+        existing: Optional[Set[str]] = None,
+        default_out: Optional[Path] = None,
     ) -> Tuple[Path, Optional[str], Optional[Path]]:
         """
         Determine the output paths and metadata block for a file.
@@ -454,20 +797,23 @@ class FileProcessor:
             file: Input audio file
             output_folder: Output folder path
             calendar_linker: Optional CalendarLinker instance
+            matched_event: Event already matched for this file by
+                CalendarLinker.match_files, or None if there was no match
+            reserved: Output paths already claimed by other files in the batch
+            existing: Stems of outputs already in the output folder; the
+                filesystem is checked if None
+            default_out: Precomputed output path under the default naming
 
         Returns:
             Tuple of (target_output_path, metadata_block, original_output_path)
         """
-        default_stem = file.stem
-        ext = f".{self.cfg.paths.output_extension.lstrip('.')}"
-        default_out = output_folder / f"{default_stem}{ext}"
+        ext = self._output_ext()
+        if default_out is None:
+            default_out = output_folder / f"{file.stem}{ext}"
 
         if not calendar_linker:
             return default_out, None, None
 
-        # Try to match file to calendar event
-        matched_event = calendar_linker.match_file(file)
-
         if matched_event is calendar_linker.USER_CANCELLED:
             # User cancelled selection - return special marker
             return default_out, calendar_linker.USER_CANCELLED, None
@@ -480,8 +826,9 @@ class FileProcessor:
         new_out = output_folder / f"{new_stem}{ext}"
 
         # Generate unique path if needed (when not reprocessing)
-        if new_out.exists():
-            new_out = generate_unique_path(output_folder, new_stem, ext)
+        new_exists = new_stem in existing if existing is not None else new_out.exists()
+        if new_exists or (reserved and new_out in reserved):
+            new_out = generate_unique_path(output_folder, new_stem, ext, reserved, existing)
 
         # Generate metadata block
         metadata_block = calendar_linker.format_event_metadata(matched_event, file)
@@ -496,6 +843,7 @@ class FileProcessor:
         llm_generator,
         llm_modes,
         output_folder: Path,
+        existing_notes: Optional[Set[str]] = None,
     ) -> tuple[bool, int, int]:
         """
         Handle the case where transcription exists and we're not reprocessing.
@@ -507,6 +855,7 @@ class FileProcessor:
             llm_generator: Optional LLM generator instance
             llm_modes: Optional modes configuration
             output_folder: Output folder path
+            existing_notes: Optional names of existing LLM notes
 
         Returns:
             Tuple of (handled: bool, processed_increment: int, skipped_increment: int)
@@ -521,10 +870,15 @@ class FileProcessor:
                 )
 
                 try:
-                    existing_content = target_out.read_text()
+                    existing_content = target_out.read_text(encoding="utf-8")
                     llm_generator.generate_for_modes(
-                        existing_content, file_modes, target_stem, output_folder, False
-                    )  # reprocess=False
+                        existing_content,
+                        file_modes,
+                        target_stem,
+                        output_folder,
+                        False,  # reprocess=False
+                        existing_outputs=existing_notes,
+                    )
                     return True, 1, 0  # handled, processed +1, skipped +0
                 except Exception as e:
                     self.logger.error(
@@ -547,7 +901,15 @@ class FileProcessor:
             )
             return True, 0, 1  # handled, processed +0, skipped +1
 
-    def _preprocess_audio(self, file: Path, trim_silence: bool, min_silence_len: int, silence_thresh: int, keep_silence: int) -> tuple[Path, Optional[Path]]:
+    def _preprocess_audio(
+        self,
+        file: Path,
+        trim_silence: bool,
+        min_silence_len: int,
+        silence_thresh: int,
+        keep_silence: int,
+        executor: Optional[Executor] = None,
+    ) -> tuple[Path, Optional[Path]]:
         """
         Preprocess audio file by removing silence if enabled.
 
@@ -557,6 +919,7 @@ class FileProcessor:
             min_silence_len: Minimum silence length in milliseconds
             silence_thresh: Silence threshold in dBFS
             keep_silence: Amount of silence to keep around segments in milliseconds
+            executor: Optional executor (e.g. a process pool) to run the trimming in
 
         Returns:
             Tuple of (source_path, temp_path) where source_path is the file to use for transcription
@@ -571,13 +934,17 @@ class FileProcessor:
 
         try:
             self.logger.debug(f"Preprocessing {file.name} -> removing silence")
-            remove_silence(
-                input_path=file,
-                output_path=temp_path,
-                min_silence_len=min_silence_len,
-                silence_thresh=silence_thresh,
-                keep_silence=keep_silence,
-            )
+            options = {
+                "input_path": file,
+                "output_path": temp_path,
+                "min_silence_len": min_silence_len,
+                "silence_thresh": silence_thresh,
+                "keep_silence": keep_silence,
+            }
+            if executor is not None:
+                executor.submit(remove_silence, **options).result()
+            else:
+                remove_silence(**options)
             self.logger.debug(f"Silence removal completed: {temp_path}")
             return temp_path, temp_path
         except Exception as e:
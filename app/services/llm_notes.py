@@ -5,13 +5,33 @@ This module provides the LLMNotesGenerator class that uses LangChain
 to generate different types of meeting notes (Q, W, E) from transcription text.
 """
 
+import asyncio
+import os
 from pathlib import Path
-from typing import Set, Dict
+from typing import Set, Dict, List, Optional, Tuple
 from langchain_openai import ChatOpenAI
 from langchain.prompts import ChatPromptTemplate
 from app.core.config_models import LLMConfig
 from app.core.utils import ensure_directory_exists
 
+try:
+    import tiktoken
+except ImportError:  # installed with langchain-openai, but not required
+    tiktoken = None
+
+# Buffer for streamed note writes, so chunks are flushed in large blocks
+_WRITE_BUFFER_SIZE = 64 * 1024
+
+# Share of the token budget kept from the start of a trimmed transcript; the rest
+# comes from its end
+_HEAD_SHARE = 0.6
+# Rough token size used when no tokenizer is available
+_CHARS_PER_TOKEN = 4
+_TRUNCATION_MARKER = "\n\n[... transcript trimmed ...]\n\n"
+
+# Supported modes, in the order notes are generated
+_MODE_ORDER = ("E", "Q", "W")
+
 
 class LLMNotesGenerator:
     """
@@ -44,11 +64,36 @@ class LLMNotesGenerator:
             api_key=cfg.api_key or None,
             base_url=cfg.base_url or None,
         )
+        # The prompt text is built per mode, so one template and chain serve every call
+        self.chain = (
+            ChatPromptTemplate.from_messages([("human", "{prompt}")]) | self.llm
+        )
+        self._encoding = None
+        self._encoding_loaded = False
+        # (mode, default_base) -> resolved folder, and folders already created
+        self._folder_cache: Dict[Tuple[str, str], Path] = {}
+        self._dirs_ensured: Set[Path] = set()
+        # Static text around the content of each mode's prompt. Joined rather than
+        # formatted, so braces in prompts or transcripts need no escaping
+        self._prompt_shells = {
+            mode: (
+                f"You are an expert meeting assistant.\n\n{user_prompt}\n\nUse the meeting content below:\n---\n",
+                "\n---\nReturn only the notes.",
+            )
+            for mode, user_prompt in (
+                ("Q", cfg.prompts.q),
+                ("W", cfg.prompts.w),
+                ("E", cfg.prompts.e),
+            )
+        }
 
     def _resolve_output_folder(self, mode: str, default_base: Path) -> Path:
         """
         Resolve the output folder for a given mode.
 
+        Results are cached per (mode, default_base), since the configuration
+        doesn't change while the generator is in use.
+
         Args:
             mode: The note mode ('Q', 'W', or 'E')
             default_base: Default output folder to use if mode-specific folder not set
@@ -56,6 +101,16 @@ class LLMNotesGenerator:
         Returns:
             Path to the resolved output folder
         """
+        key = (mode, str(default_base))
+        folder = self._folder_cache.get(key)
+        if folder is None:
+            folder = self._folder_cache[key] = self._compute_output_folder(
+                mode, default_base
+            )
+        return folder
+
+    def _compute_output_folder(self, mode: str, default_base: Path) -> Path:
+        """Resolve the output folder for a mode from the configuration."""
         mapping = {
             "Q": self.cfg.paths.q_output_folder,
             "W": self.cfg.paths.w_output_folder,
@@ -75,6 +130,36 @@ class LLMNotesGenerator:
             # Join relative path with default_base and resolve
             return (Path(default_base) / p).resolve()
 
+    def list_existing_notes(self, base_output: Path) -> Set[str]:
+        """
+        List the names of notes already present in the Q/W/E output folders.
+
+        Each distinct folder is read once, so a batch can answer "does this note
+        exist" with a set lookup instead of a stat per mode per file.
+
+        Args:
+            base_output: Default output folder
+
+        Returns:
+            Set of existing note file names (e.g. "meeting.Q.md")
+        """
+        suffixes = tuple(f".{mode}{self.ext}" for mode in ("Q", "W", "E"))
+        folders = {
+            self._resolve_output_folder(mode, base_output) for mode in ("Q", "W", "E")
+        }
+        names: Set[str] = set()
+        for folder in folders:
+            try:
+                with os.scandir(folder) as it:
+                    names.update(
+                        entry.name
+                        for entry in it
+                        if entry.name.endswith(suffixes) and entry.is_file()
+                    )
+            except FileNotFoundError:
+                continue
+        return names
+
     def _build_prompt(self, mode: str, content: str) -> str:
         """
         Build the complete prompt for a given mode and content.
@@ -86,13 +171,8 @@ class LLMNotesGenerator:
         Returns:
             Complete prompt string with system instructions and content
         """
-        prompt_map = {
-            "Q": self.cfg.prompts.q,
-            "W": self.cfg.prompts.w,
-            "E": self.cfg.prompts.e,
-        }
-        user_prompt = prompt_map[mode]
-        return f"You are an expert meeting assistant.\n\n{user_prompt}\n\nUse the meeting content below:\n---\n{content}\n---\nReturn only the notes."
+        head, tail = self._prompt_shells[mode]
+        return "".join((head, content, tail))
 
     def generate_for_modes(
         self,
@@ -101,6 +181,7 @@ class LLMNotesGenerator:
         file_stem: str,
         base_output: Path,
         reprocess: bool,
+        existing_outputs: Optional[Set[str]] = None,
     ) -> Dict[str, Path]:
         """
         Generate LLM notes for the specified modes.
@@ -111,58 +192,412 @@ class LLMNotesGenerator:
             file_stem: Base filename stem (without extension)
             base_output: Default output folder
             reprocess: Whether to overwrite existing files
+            existing_outputs: Optional names of existing notes, as returned by
+                list_existing_notes; the filesystem is checked if None. Updated
+                in place as notes are written.
 
         Returns:
             Dictionary mapping mode letters to generated file paths
         """
+        outputs, pending = self._plan_modes(
+            modes, file_stem, base_output, reprocess, existing_outputs
+        )
+        if not pending:
+            return outputs
+        content = self._preprocess_content(content, file_stem)
+
+        if len(pending) > 1 and not self._in_running_loop():
+            # Request every mode at once so total latency is that of the slowest mode
+            results = asyncio.run(
+                self._agenerate_all(
+                    pending, content, file_stem, existing_outputs=existing_outputs
+                )
+            )
+        else:
+            results = [
+                self._generate_one(mode, target, content, file_stem, existing_outputs)
+                for mode, target in pending
+            ]
+
+        for (mode, _), target in zip(pending, results):
+            if target is not None:
+                outputs[mode] = target
+
+        return outputs
+
+    def generate_for_files(
+        self,
+        jobs: List[Tuple],
+        concurrency: Optional[int] = None,
+    ) -> List[Dict[str, Path]]:
+        """
+        Generate LLM notes for several files, overlapping their requests.
+
+        Args:
+            jobs: List of (content, modes, file_stem, base_output, reprocess[,
+                existing_outputs]) tuples, the arguments generate_for_modes
+                takes for each file
+            concurrency: Maximum requests in flight; defaults to
+                cfg.max_concurrent_requests
+
+        Returns:
+            For each job, a dictionary mapping mode letters to generated file paths
+        """
+        if len(jobs) <= 1 or self._in_running_loop():
+            return [self.generate_for_modes(*job) for job in jobs]
+        return asyncio.run(self.agenerate_for_files(jobs, concurrency))
+
+    async def agenerate_for_files(
+        self,
+        jobs: List[Tuple],
+        concurrency: Optional[int] = None,
+    ) -> List[Dict[str, Path]]:
+        """
+        Generate LLM notes for several files concurrently.
+
+        A semaphore bounds the number of requests in flight across all files
+        and modes. A failing job is logged and yields an empty result without
+        affecting the others.
+
+        Args:
+            jobs: List of (content, modes, file_stem, base_output, reprocess[,
+                existing_outputs]) tuples
+            concurrency: Maximum requests in flight; defaults to
+                cfg.max_concurrent_requests
+
+        Returns:
+            For each job, a dictionary mapping mode letters to generated file paths
+        """
+        limit = (
+            concurrency if concurrency is not None else self.cfg.max_concurrent_requests
+        )
+        sem = asyncio.Semaphore(max(1, int(limit)))
+
+        async def run_job(
+            content, modes, file_stem, base_output, reprocess, existing=None
+        ):
+            outputs, pending = self._plan_modes(
+                modes, file_stem, base_output, reprocess, existing
+            )
+            if pending:
+                content = self._preprocess_content(content, file_stem)
+            results = await self._agenerate_all(
+                pending, content, file_stem, sem, existing
+            )
+            for (mode, _), target in zip(pending, results):
+                if target is not None:
+                    outputs[mode] = target
+            return outputs
+
+        results = await asyncio.gather(
+            *(run_job(*job) for job in jobs), return_exceptions=True
+        )
+        for job, result in zip(jobs, results):
+            if isinstance(result, BaseException):
+                self.logger.error(
+                    f"Failed to generate LLM notes for {job[2]}: {result}"
+                )
+        return [result if isinstance(result, dict) else {} for result in results]
+
+    def _preprocess_content(self, content: str, file_stem: str) -> str:
+        """
+        Shrink a transcript before it is sent to the LLM.
+
+        Consecutive duplicate lines, common in ASR output, are collapsed. If
+        cfg.max_input_tokens is set and the transcript is longer, its middle is
+        dropped, keeping the start and end. Done once per file and shared by
+        all modes.
+
+        Args:
+            content: The transcription content to process
+            file_stem: Base filename stem, used in log messages
+
+        Returns:
+            The content to embed in the prompts
+        """
+        lines = content.split("\n")
+        kept = [lines[0]]
+        for line in lines[1:]:
+            if line != kept[-1] or not line.strip():
+                kept.append(line)
+        if len(kept) < len(lines):
+            content = "\n".join(kept)
+
+        limit = int(self.cfg.max_input_tokens)
+        if limit <= 0:
+            return content
+
+        head = int(limit * _HEAD_SHARE)
+        tail = limit - head
+        encoding = self._get_encoding()
+        if encoding is None:
+            if len(content) <= limit * _CHARS_PER_TOKEN:
+                return content
+            trimmed = (
+                content[: head * _CHARS_PER_TOKEN]
+                + _TRUNCATION_MARKER
+                + content[-tail * _CHARS_PER_TOKEN :]
+            )
+        else:
+            tokens = encoding.encode(content, disallowed_special=())
+            if len(tokens) <= limit:
+                return content
+            trimmed = (
+                encoding.decode(tokens[:head])
+                + _TRUNCATION_MARKER
+                + encoding.decode(tokens[-tail:])
+            )
+        self.logger.info(
+            f"Transcript for {file_stem} exceeds {limit} tokens; sending its start and end only"
+        )
+        return trimmed
+
+    def _get_encoding(self):
+        """Return the tokenizer for the configured model, or None if unavailable."""
+        if not self._encoding_loaded:
+            self._encoding_loaded = True
+            if tiktoken is not None:
+                try:
+                    try:
+                        self._encoding = tiktoken.encoding_for_model(self.cfg.model)
+                    except KeyError:
+                        # Model unknown to tiktoken (e.g. served from a custom base_url)
+                        self._encoding = tiktoken.get_encoding("o200k_base")
+                except Exception as e:
+                    # Encodings are downloaded on first use and may be unreachable
+                    self.logger.debug(f"Tokenizer unavailable, estimating tokens: {e}")
+        return self._encoding
+
+    def _plan_modes(
+        self,
+        modes: Set[str],
+        file_stem: str,
+        base_output: Path,
+        reprocess: bool,
+        existing_outputs: Optional[Set[str]] = None,
+    ) -> Tuple[Dict[str, Path], List[Tuple[str, Path]]]:
+        """
+        Resolve output targets and split modes into already done and pending.
+
+        Args:
+            modes: Set of modes to generate ('Q', 'W', 'E')
+            file_stem: Base filename stem (without extension)
+            base_output: Default output folder
+            reprocess: Whether to overwrite existing files
+            existing_outputs: Optional names of existing notes; the filesystem
+                is checked if None
+
+        Returns:
+            Tuple of (outputs for modes whose notes already exist,
+            list of (mode, target_path) still to generate)
+        """
         outputs: Dict[str, Path] = {}
+        pending: List[Tuple[str, Path]] = []
 
-        for mode in sorted({m.upper() for m in modes}):
+        # FileProcessor passes canonical frozensets of uppercase letters
+        if not isinstance(modes, frozenset):
+            modes = {m.upper() for m in modes}
+        for mode in _MODE_ORDER:
+            if mode not in modes:
+                continue
             try:
                 folder = self._resolve_output_folder(mode, base_output)
-                ensure_directory_exists(folder, self.logger)
+                if folder not in self._dirs_ensured:
+                    ensure_directory_exists(folder, self.logger)
+                    self._dirs_ensured.add(folder)
                 target = folder / f"{file_stem}.{mode}{self.ext}"
 
-                if not reprocess and target.exists():
+                if not reprocess and (
+                    target.name in existing_outputs
+                    if existing_outputs is not None
+                    else target.exists()
+                ):
                     self.logger.info(
                         f"Skipping LLM {mode} for {file_stem}: {target} already exists"
                     )
                     outputs[mode] = target
                     continue
 
-                prompt_text = self._build_prompt(mode, content)
-                tpl = ChatPromptTemplate.from_messages([("human", "{prompt}")])
-                chain = tpl | self.llm
-                resp = chain.invoke({"prompt": prompt_text})
-                text = resp.content if hasattr(resp, "content") else str(resp)
-
-                target.write_text(text)
-                self.logger.info(f"LLM {mode} notes saved to {target}")
-                outputs[mode] = target
+                pending.append((mode, target))
 
             except Exception as e:
-                # Provide detailed error information for debugging
-                error_type = type(e).__name__
-                error_msg = str(e)
-                self.logger.error(
-                    f"Failed to generate LLM {mode} for {file_stem}: {error_type}: {error_msg}"
+                self._log_generation_error(mode, file_stem, e)
+
+        return outputs, pending
+
+    @staticmethod
+    def _in_running_loop() -> bool:
+        """Return True if called from inside a running asyncio event loop."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return True
+
+    async def _agenerate_all(
+        self,
+        pending: List[Tuple[str, Path]],
+        content: str,
+        file_stem: str,
+        sem: Optional[asyncio.Semaphore] = None,
+        existing_outputs: Optional[Set[str]] = None,
+    ) -> List[Optional[Path]]:
+        """
+        Generate notes for several modes concurrently.
+
+        Args:
+            pending: List of (mode, target_path) pairs to generate
+            content: The transcription content to process
+            file_stem: Base filename stem, used in log messages
+            sem: Optional semaphore bounding requests shared with other files
+            existing_outputs: Optional set of note names to record written notes in
+
+        Returns:
+            Target path for each pair, or None where generation failed
+        """
+        return await asyncio.gather(
+            *(
+                self._agenerate_one(
+                    mode, target, content, file_stem, sem, existing_outputs
                 )
+                for mode, target in pending
+            )
+        )
 
-                # Log additional context for common errors
-                if "connection" in error_msg.lower() or "timeout" in error_msg.lower():
-                    self.logger.error(
-                        f"Connection details: model={self.cfg.model}, base_url={self.cfg.base_url}, api_key={'***' if self.cfg.api_key else 'None'}"
-                    )
-                elif (
-                    "authentication" in error_msg.lower()
-                    or "unauthorized" in error_msg.lower()
-                ):
-                    self.logger.error(
-                        f"Authentication issue: api_key={'***' if self.cfg.api_key else 'None'}, base_url={self.cfg.base_url}"
-                    )
-                elif "model" in error_msg.lower():
-                    self.logger.error(
-                        f"Model issue: model={self.cfg.model}, available models may vary by provider"
-                    )
+    async def _agenerate_one(
+        self,
+        mode: str,
+        target: Path,
+        content: str,
+        file_stem: str,
+        sem: Optional[asyncio.Semaphore] = None,
+        existing_outputs: Optional[Set[str]] = None,
+    ) -> Optional[Path]:
+        """
+        Stream notes for one mode to disk without blocking the event loop.
 
-        return outputs
+        Args:
+            mode: The note mode ('Q', 'W', or 'E')
+            target: Output file path
+            content: The transcription content to process
+            file_stem: Base filename stem, used in log messages
+            sem: Optional semaphore held for the duration of the request
+            existing_outputs: Optional set of note names to record the note in
+
+        Returns:
+            The target path, or None if generation failed
+        """
+        partial = self._partial_path(target)
+        try:
+            prompt = {"prompt": self._build_prompt(mode, content)}
+            if sem is None:
+                await self._astream_to_file(prompt, partial)
+            else:
+                async with sem:
+                    await self._astream_to_file(prompt, partial)
+            return self._finish_output(mode, partial, target, existing_outputs)
+        except Exception as e:
+            partial.unlink(missing_ok=True)
+            self._log_generation_error(mode, file_stem, e)
+            return None
+
+    def _generate_one(
+        self,
+        mode: str,
+        target: Path,
+        content: str,
+        file_stem: str,
+        existing_outputs: Optional[Set[str]] = None,
+    ) -> Optional[Path]:
+        """
+        Stream notes for one mode to disk as the response arrives.
+
+        Args:
+            mode: The note mode ('Q', 'W', or 'E')
+            target: Output file path
+            content: The transcription content to process
+            file_stem: Base filename stem, used in log messages
+            existing_outputs: Optional set of note names to record the note in
+
+        Returns:
+            The target path, or None if generation failed
+        """
+        partial = self._partial_path(target)
+        try:
+            prompt = {"prompt": self._build_prompt(mode, content)}
+            with self._open_partial(partial) as fp:
+                for chunk in self.chain.stream(prompt):
+                    self._write_chunk(fp, chunk)
+            return self._finish_output(mode, partial, target, existing_outputs)
+        except Exception as e:
+            partial.unlink(missing_ok=True)
+            self._log_generation_error(mode, file_stem, e)
+            return None
+
+    async def _astream_to_file(self, prompt: Dict[str, str], partial: Path) -> None:
+        """Stream an LLM response into a file chunk by chunk."""
+        with self._open_partial(partial) as fp:
+            async for chunk in self.chain.astream(prompt):
+                self._write_chunk(fp, chunk)
+
+    @staticmethod
+    def _write_chunk(fp, chunk) -> None:
+        """Append one streamed response chunk to an open binary file."""
+        piece = chunk.content if hasattr(chunk, "content") else str(chunk)
+        if piece:
+            fp.write(piece.encode("utf-8"))
+
+    def _open_partial(self, partial: Path):
+        """Open a note's partial file for writing, recreating its folder if it was removed."""
+        try:
+            return open(partial, "wb", buffering=_WRITE_BUFFER_SIZE)
+        except FileNotFoundError:
+            # The folder was deleted since it was first ensured (e.g. in watch mode)
+            ensure_directory_exists(partial.parent, self.logger)
+            return open(partial, "wb", buffering=_WRITE_BUFFER_SIZE)
+
+    @staticmethod
+    def _partial_path(target: Path) -> Path:
+        """Hidden sibling a note is streamed into before it replaces the target."""
+        return target.with_name(f".{target.name}.part")
+
+    def _finish_output(
+        self,
+        mode: str,
+        partial: Path,
+        target: Path,
+        existing_outputs: Optional[Set[str]] = None,
+    ) -> Path:
+        """Move a fully streamed note into place and return its path."""
+        # Only complete responses reach the target, so an interrupted request
+        # never leaves a truncated note that later runs would skip
+        os.replace(partial, target)
+        if existing_outputs is not None:
+            existing_outputs.add(target.name)
+        self.logger.info(f"LLM {mode} notes saved to {target}")
+        return target
+
+    def _log_generation_error(self, mode: str, file_stem: str, e: Exception) -> None:
+        """Log a failed generation, with extra context for common error types."""
+        # Provide detailed error information for debugging
+        error_type = type(e).__name__
+        error_msg = str(e)
+        self.logger.error(
+            f"Failed to generate LLM {mode} for {file_stem}: {error_type}: {error_msg}"
+        )
+
+        # Log additional context for common errors
+        if "connection" in error_msg.lower() or "timeout" in error_msg.lower():
+            self.logger.error(
+                f"Connection details: model={self.cfg.model}, base_url={self.cfg.base_url}, api_key={'***' if self.cfg.api_key else 'None'}"
+            )
+        elif (
+            "authentication" in error_msg.lower() or "unauthorized" in error_msg.lower()
+        ):
+            self.logger.error(
+                f"Authentication issue: api_key={'***' if self.cfg.api_key else 'None'}, base_url={self.cfg.base_url}"
+            )
+        elif "model" in error_msg.lower():
+            self.logger.error(
+                f"Model issue: model={self.cfg.model}, available models may vary by provider"
+            )
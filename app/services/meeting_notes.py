@@ -5,14 +5,83 @@ This module provides functionality to generate Obsidian-ready meeting notes
 from Google Calendar events using configurable markdown templates.
 """
 
+import os
+import re
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 from app.core.config_models import MeetingNotesConfig
 from app.integrations.google_calendar import GoogleCalendarClient
 from app.core.utils import sanitize_filename, ensure_directory_exists
 
+# Matches every supported placeholder, capturing its name
+_PLACEHOLDER_RE = re.compile(
+    r"\{\{(TITLE|WHEN|ATTENDEES|ATTACHMENTS|EVENT_LINK|CALENDAR_ID|AUTOMATIC_NOTES)\}\}"
+)
+
+# Flattens line breaks in single-line values so they can't break the template layout
+_INLINE_VALUE = str.maketrans({"\r": " ", "\n": " "})
+
+# Simple default template
+_DEFAULT_TEMPLATE = """# {{TITLE}}
+
+**When:** {{WHEN}}
+**Attendees:** {{ATTENDEES}}
+
+## Notes
+
+{{AUTOMATIC_NOTES}}
+"""
+
+
+def _compile_template(raw: str) -> str:
+    """
+    Convert a {{KEY}} template into str.format_map syntax.
+
+    Placeholders become {key}; any other braces are doubled so they render
+    literally.
+
+    Args:
+        raw: Template text with {{KEY}} placeholders
+
+    Returns:
+        Template ready for format_map with lowercase placeholder names
+    """
+    pieces = []
+    last = 0
+    for match in _PLACEHOLDER_RE.finditer(raw):
+        pieces.append(raw[last : match.start()].replace("{", "{{").replace("}", "}}"))
+        pieces.append(f"{{{match.group(1).lower()}}}")
+        last = match.end()
+    pieces.append(raw[last:].replace("{", "{{").replace("}", "}}"))
+    return "".join(pieces)
+
+
+_DEFAULT_COMPILED_TEMPLATE = _compile_template(_DEFAULT_TEMPLATE)
+
+
+@lru_cache(maxsize=2048)
+def _join_limited(items: Tuple[str, ...], limit: int) -> str:
+    """
+    Join names for display, summarizing those beyond the limit.
+
+    Memoized, since events in a recurring series repeat the same lists.
+
+    Args:
+        items: Names to join
+        limit: Maximum number of names shown before "+N more"
+
+    Returns:
+        Comma-separated names, or "None" if there are none
+    """
+    if not items:
+        return "None"
+    if len(items) <= limit:
+        return ", ".join(items)
+    return ", ".join(items[:limit]) + f" +{len(items) - limit} more"
+
 
 class EventNotesGenerator:
     """
@@ -32,6 +101,8 @@ class EventNotesGenerator:
         """
         self.cfg = cfg
         self.logger = logger
+        # (mtime_ns, compiled template) of the template file last read
+        self._template_cache: Optional[Tuple[int, str]] = None
 
     def _parse_event_times(
         self, event: Dict[str, Any]
@@ -52,13 +123,12 @@ class EventNotesGenerator:
         if "date" in start_info:
             # All-day event
             date_str = start_info["date"]
-            start_dt = datetime.fromisoformat(date_str).replace(
-                tzinfo=datetime.now().astimezone().tzinfo
-            )
-            end_date_str = end_info.get("date", date_str)
-            end_dt = datetime.fromisoformat(end_date_str).replace(
-                tzinfo=datetime.now().astimezone().tzinfo
-            )
+            start_dt = datetime.fromisoformat(date_str).astimezone()
+            end_date_str = end_info.get("date")
+            if not end_date_str or end_date_str == date_str:
+                end_dt = start_dt
+            else:
+                end_dt = datetime.fromisoformat(end_date_str).astimezone()
             return start_dt, end_dt
 
         # Handle timed events
@@ -75,10 +145,9 @@ class EventNotesGenerator:
             start_dt = datetime.fromisoformat(start_dt_str)
             end_dt = datetime.fromisoformat(end_dt_str)
 
-            # Convert to local timezone
-            local_tz = datetime.now().astimezone().tzinfo
-            start_dt = start_dt.astimezone(local_tz)
-            end_dt = end_dt.astimezone(local_tz)
+            # Convert to local time, with the offset in effect at each instant (DST)
+            start_dt = start_dt.astimezone()
+            end_dt = end_dt.astimezone()
 
             return start_dt, end_dt
 
@@ -94,57 +163,57 @@ class EventNotesGenerator:
         Returns:
             Rendered markdown content
         """
-        # Get template content
-        template_content = self._get_template_content()
+        # Get template, already converted for format_map
+        template = self._get_template_content()
 
         # Parse event times
         local_start, local_end = self._parse_event_times(event)
 
         # Build replacement values
         replacements = {
-            "{{TITLE}}": event.get("summary", "Untitled Event"),
-            "{{WHEN}}": self._format_event_when(local_start, local_end, event),
-            "{{ATTENDEES}}": self._format_attendees(event),
-            "{{ATTACHMENTS}}": self._format_attachments(event),
-            "{{EVENT_LINK}}": event.get("htmlLink", ""),
-            "{{CALENDAR_ID}}": event.get("organizer", {}).get("email", "primary"),
-            "{{AUTOMATIC_NOTES}}": "<!-- Add automatic notes here -->",
+            "title": event.get("summary", "Untitled Event").translate(_INLINE_VALUE),
+            "when": self._format_event_when(local_start, local_end, event),
+            "attendees": self._format_attendees(event).translate(_INLINE_VALUE),
+            "attachments": self._format_attachments(event).translate(_INLINE_VALUE),
+            "event_link": event.get("htmlLink", ""),
+            "calendar_id": event.get("organizer", {}).get("email", "primary"),
+            "automatic_notes": "<!-- Add automatic notes here -->",
         }
 
-        # Apply replacements
-        content = template_content
-        for placeholder, value in replacements.items():
-            content = content.replace(placeholder, value)
-
-        return content
+        # Apply all replacements in a single pass
+        return template.format_map(replacements)
 
     def _get_template_content(self) -> str:
         """
-        Get template content from file or use built-in default.
+        Get the compiled template from file or use the built-in default.
+
+        The file is only re-read and compiled when its modification time changes.
 
         Returns:
-            Template content as string
+            Template in str.format_map syntax (see _compile_template)
         """
-        if self.cfg.template_file.exists():
-            try:
-                with open(self.cfg.template_file, "r", encoding="utf-8") as f:
-                    return f.read()
-            except Exception as e:
-                self.logger.warning(
-                    f"Failed to read template file {self.cfg.template_file}: {e}"
-                )
-                self.logger.warning("Using built-in default template")
-
-        # Simple default template
-        return """# {{TITLE}}
+        try:
+            mtime_ns = self.cfg.template_file.stat().st_mtime_ns
+        except OSError:
+            return _DEFAULT_COMPILED_TEMPLATE
 
-**When:** {{WHEN}}
-**Attendees:** {{ATTENDEES}}
+        cached = self._template_cache
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
 
-## Notes
+        try:
+            with open(self.cfg.template_file, "r", encoding="utf-8") as f:
+                content = f.read()
+        except Exception as e:
+            self.logger.warning(
+                f"Failed to read template file {self.cfg.template_file}: {e}"
+            )
+            self.logger.warning("Using built-in default template")
+            return _DEFAULT_COMPILED_TEMPLATE
 
-{{AUTOMATIC_NOTES}}
-"""
+        compiled = _compile_template(content)
+        self._template_cache = (mtime_ns, compiled)
+        return compiled
 
     def _format_event_when(
         self,
@@ -186,14 +255,9 @@ class EventNotesGenerator:
         Returns:
             Formatted attendee string
         """
-        attendees = GoogleCalendarClient.extract_attendee_names(event)
-        if not attendees:
-            return "None"
-
-        if len(attendees) <= 10:
-            return ", ".join(attendees)
-        else:
-            return ", ".join(attendees[:10]) + f" +{len(attendees) - 10} more"
+        return _join_limited(
+            tuple(GoogleCalendarClient.extract_attendee_names(event)), 10
+        )
 
     def _format_attachments(self, event: Dict[str, Any]) -> str:
         """
@@ -205,14 +269,9 @@ class EventNotesGenerator:
         Returns:
             Formatted attachment string
         """
-        attachments = GoogleCalendarClient.extract_attachment_titles(event)
-        if not attachments:
-            return "None"
-
-        if len(attachments) <= 5:
-            return ", ".join(attachments)
-        else:
-            return ", ".join(attachments[:5]) + f" +{len(attachments) - 5} more"
+        return _join_limited(
+            tuple(GoogleCalendarClient.extract_attachment_titles(event)), 5
+        )
 
     def compute_target_stem(self, event: Dict[str, Any]) -> str:
         """
@@ -252,29 +311,40 @@ class EventNotesGenerator:
 
         # Compute target filename
         stem = self.compute_target_stem(event)
-        filename = f"{stem}.{self.cfg.output_extension}"
-        target_path = self.cfg.output_folder / filename
-
-        # Handle file conflicts by adding unique suffix
-        if target_path.exists():
-            counter = 1
-            while True:
-                unique_filename = f"{stem}_{counter}.{self.cfg.output_extension}"
-                unique_path = self.cfg.output_folder / unique_filename
-                if not unique_path.exists():
-                    target_path = unique_path
-                    break
-                counter += 1
+        ext = self.cfg.output_extension
 
         # Render template
-        content = self._render_template(event)
+        content = self._render_template(event).encode("utf-8")
 
-        # Write file
+        # Pick the first free name from one listing of the folder, then claim it
+        # with an exclusive create so a file that appears meanwhile is never
+        # overwritten; on a collision the next suffix is tried
         try:
-            with open(target_path, "w", encoding="utf-8") as f:
-                f.write(content)
+            with os.scandir(self.cfg.output_folder) as it:
+                existing = {entry.name for entry in it}
+        except OSError:
+            existing = set()
+
+        counter = 0
+        while True:
+            filename = f"{stem}.{ext}" if counter == 0 else f"{stem}_{counter}.{ext}"
+            counter += 1
+            if filename in existing:
+                continue
+            target_path = self.cfg.output_folder / filename
+            try:
+                with open(target_path, "xb") as f:
+                    try:
+                        f.write(content)
+                    except BaseException:
+                        # Don't leave a truncated note behind
+                        f.close()
+                        target_path.unlink(missing_ok=True)
+                        raise
+            except FileExistsError:
+                continue
+            except Exception as e:
+                self.logger.error(f"Failed to create meeting note {target_path}: {e}")
+                raise
             self.logger.info(f"Created meeting note: {target_path}")
             return target_path
-        except Exception as e:
-            self.logger.error(f"Failed to create meeting note {target_path}: {e}")
-            raise
@@ -2,8 +2,10 @@
 Handles audio transcription and analysis using the Deepgram API.
 """
 
-from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+from typing import Optional
 
 from deepgram import DeepgramClient, PrerecordedOptions
 
@@ -11,16 +13,24 @@ from app.core.config_models import DeepgramConfig
 from app.core.exceptions import TranscriptionError
 
 
-# Supported audio file extensions
-SUPPORTED_EXTENSIONS = {".wav", ".mp3", ".m4a", ".aac"}
+# Supported audio file extensions (lowercase, with leading dot)
+SUPPORTED_EXTENSIONS = frozenset({".wav", ".mp3", ".m4a", ".aac"})
 
-# MIME type mapping for supported extensions
-MIMETYPE_BY_EXT = {
-    ".wav": "audio/wav",
-    ".mp3": "audio/mpeg",
-    ".m4a": "audio/mp4",
-    ".aac": "audio/aac",
-}
+# MIME type mapping for supported extensions (read-only)
+MIMETYPE_BY_EXT = MappingProxyType(
+    {
+        ".wav": "audio/wav",
+        ".mp3": "audio/mpeg",
+        ".m4a": "audio/mp4",
+        ".aac": "audio/aac",
+    }
+)
+
+
+@lru_cache(maxsize=4)
+def _client_for(api_key: str) -> DeepgramClient:
+    """Return a shared DeepgramClient for an API key."""
+    return DeepgramClient(api_key)
 
 
 class Transcriber:
@@ -38,7 +48,38 @@ class Transcriber:
         """
         self.cfg = cfg
         self.logger = logger
-        self.client = DeepgramClient(self.cfg.api_key)
+        self.client = _client_for(self.cfg.api_key)
+        # Options come from the config alone, so they are built on first use and reused
+        self._options: Optional[PrerecordedOptions] = None
+
+    def _build_options(self) -> PrerecordedOptions:
+        """
+        Build the Deepgram transcription options from the configuration.
+
+        Returns:
+            The options passed with every transcription request.
+        """
+        cfg = self.cfg
+        options_kwargs = {
+            "model": cfg.model,
+            "language": cfg.language,
+            "smart_format": cfg.smart_format,
+            "diarize": cfg.diarize,
+            "summarize": cfg.summarize,
+            "detect_topics": cfg.detect_topics,
+            "intents": cfg.intents,
+        }
+        diarize_speakers = cfg.diarize_speakers
+        if diarize_speakers > 0:
+            options_kwargs["diarize_speakers"] = int(diarize_speakers)
+        min_speaker_gap = cfg.min_speaker_gap
+        if min_speaker_gap > 0:
+            options_kwargs["min_speaker_gap"] = float(min_speaker_gap)
+        max_speaker_gap = cfg.max_speaker_gap
+        if max_speaker_gap > 0:
+            options_kwargs["max_speaker_gap"] = float(max_speaker_gap)
+
+        return PrerecordedOptions(**options_kwargs)
 
     def _get_mimetype(self, file_path: Path) -> str:
         """
@@ -71,29 +112,15 @@ class Transcriber:
         try:
             with open(file_path, "rb") as audio_file:
                 mimetype = self._get_mimetype(file_path)
-                source = {"buffer": audio_file.read(), "mimetype": mimetype}
-
-                # Read config-driven options from typed config
-                options_kwargs = {
-                    "model": self.cfg.model,
-                    "language": self.cfg.language,
-                    "smart_format": self.cfg.smart_format,
-                    "diarize": self.cfg.diarize,
-                    "summarize": self.cfg.summarize,
-                    "detect_topics": self.cfg.detect_topics,
-                    "intents": self.cfg.intents,
-                }
-                if self.cfg.diarize_speakers > 0:
-                    options_kwargs["diarize_speakers"] = int(self.cfg.diarize_speakers)
-                if self.cfg.min_speaker_gap > 0:
-                    options_kwargs["min_speaker_gap"] = float(self.cfg.min_speaker_gap)
-                if self.cfg.max_speaker_gap > 0:
-                    options_kwargs["max_speaker_gap"] = float(self.cfg.max_speaker_gap)
-
-                options = PrerecordedOptions(**options_kwargs)
+                # Hand the SDK the open file so the upload streams from disk
+                # instead of holding the whole recording in memory
+                source = {"stream": audio_file, "mimetype": mimetype}
+
+                if self._options is None:
+                    self._options = self._build_options()
 
                 response = self.client.listen.prerecorded.v("1").transcribe_file(
-                    source, options
+                    source, self._options
                 )
 
                 return self._format_results(response)
@@ -177,12 +204,15 @@ class Transcriber:
         """Format a list of strings into a markdown list."""
         if not items:
             return "- None"
-        return "\n".join(f"- {item}" for item in items)
+        return "- " + "\n- ".join(map(str, items))
 
     def _format_speaker_timeline(self, results) -> str:
         """
         Format speaker timeline from diarization results.
 
+        Consecutive utterances, paragraphs or words by the same speaker are
+        merged into one line, in the order they were spoken.
+
         Args:
             results: The Deepgram results object.
 
@@ -190,48 +220,72 @@ class Transcriber:
             A formatted string with speaker timeline or "- None" if unavailable.
         """
         try:
-            if hasattr(results, "utterances") and results.utterances:
-                lines = []
-                for u in results.utterances:
-                    spk = getattr(u, "speaker", "Unknown")
-                    text = getattr(u, "transcript", "") or ""
-                    if text:
-                        lines.append(f"- Speaker {spk}: {text}")
-                return "\n".join(lines) if lines else "- None"
+            # One getattr with a default per attribute, rather than hasattr plus access
+            utterances = getattr(results, "utterances", None)
+            if utterances:
+                return self._join_speaker_runs(
+                    (
+                        getattr(u, "speaker", "Unknown"),
+                        getattr(u, "transcript", "") or "",
+                    )
+                    for u in utterances
+                )
 
             alt0 = None
-            if getattr(results, "channels", None) and results.channels[0].alternatives:
-                alt0 = results.channels[0].alternatives[0]
-
-            if alt0 and hasattr(alt0, "paragraphs") and alt0.paragraphs:
-                paragraphs = getattr(alt0.paragraphs, "paragraphs", None) or []
-                lines = []
-                for p in paragraphs:
-                    spk = getattr(p, "speaker", "Unknown")
-                    text = getattr(p, "transcript", "") or ""
-                    if not text and hasattr(p, "sentences"):
-                        text = " ".join(
-                            getattr(s, "text", "")
-                            for s in p.sentences
-                            if getattr(s, "text", "")
-                        )
-                    if text:
-                        lines.append(f"- Speaker {spk}: {text}")
-                return "\n".join(lines) if lines else "- None"
-
-            if alt0 and hasattr(alt0, "words") and alt0.words:
-                by_spk = defaultdict(list)
-                for w in alt0.words:
-                    spk = getattr(w, "speaker", "Unknown")
-                    word = getattr(w, "word", "")
-                    if word:
-                        by_spk[spk].append(word)
-                lines = [
-                    f"- Speaker {spk}: {' '.join(words)}"
-                    for spk, words in by_spk.items()
-                    if words
-                ]
-                return "\n".join(lines) if lines else "- None"
+            channels = getattr(results, "channels", None)
+            if channels and channels[0].alternatives:
+                alt0 = channels[0].alternatives[0]
+
+            paragraphs = getattr(alt0, "paragraphs", None)
+            if paragraphs:
+                return self._join_speaker_runs(
+                    (getattr(p, "speaker", "Unknown"), self._paragraph_text(p))
+                    for p in getattr(paragraphs, "paragraphs", None) or []
+                )
+
+            words = getattr(alt0, "words", None)
+            if words:
+                return self._join_speaker_runs(
+                    (getattr(w, "speaker", "Unknown"), getattr(w, "word", ""))
+                    for w in words
+                )
         except Exception as e:
             self.logger.debug(f"Diarization formatting fallback: {e}")
         return "- None"
+
+    @staticmethod
+    def _paragraph_text(paragraph) -> str:
+        """Return a paragraph's transcript, rebuilt from its sentences if missing."""
+        text = getattr(paragraph, "transcript", "") or ""
+        if not text:
+            sentences = getattr(paragraph, "sentences", None) or []
+            text = " ".join(t for t in (getattr(s, "text", "") for s in sentences) if t)
+        return text
+
+    @staticmethod
+    def _join_speaker_runs(items) -> str:
+        """
+        Format (speaker, text) pairs as timeline lines, one per run of a speaker.
+
+        Args:
+            items: Iterable of (speaker, text) pairs in spoken order; empty
+                texts are skipped
+
+        Returns:
+            Markdown list of speaker lines, or "- None" if there is no text
+        """
+        lines = []
+        append_line = lines.append
+        current_spk = None
+        parts: list = []
+        for spk, text in items:
+            if not text:
+                continue
+            if parts and spk != current_spk:
+                append_line(f"- Speaker {current_spk}: {' '.join(parts)}")
+                parts = []
+            current_spk = spk
+            parts.append(text)
+        if parts:
+            append_line(f"- Speaker {current_spk}: {' '.join(parts)}")
+        return "\n".join(lines) if lines else "- None"
@@ -5,6 +5,8 @@ This module provides interactive user interface components for file selection
 and other interactive operations.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional
 from math import ceil
@@ -13,9 +15,36 @@ from rich.console import Console
 from rich.live import Live
 from rich.table import Table
 
+from app.core.duration_cache import DurationCache
 from app.integrations.google_calendar import GoogleCalendarClient
 from app.core.utils import truncate_attendees, truncate_attachments
 
+# Row style marking the highlighted entry in the selection tables
+_CURSOR_STYLE = "black on cyan"
+
+# File picker mode indicator keyed by (processed, queued)
+_MODE_MARKERS = {
+    (True, True): "✓",  # processed
+    (True, False): "✓",  # processed
+    (False, True): "o",  # queued to process
+    (False, False): "-",  # not selected
+}
+
+
+def _move_cursor(table: Table, old_index: int, new_index: int) -> None:
+    """Move the cursor highlight between two rows of an already built table."""
+    table.rows[old_index].style = None
+    table.rows[new_index].style = _CURSOR_STYLE
+
+
+def _list_names(folder: Path) -> set[str]:
+    """Return the entry names in a folder, or an empty set if it can't be read."""
+    try:
+        with os.scandir(folder) as it:
+            return {entry.name for entry in it}
+    except OSError:
+        return set()
+
 
 def interactive_select_files(
     files: List[Path],
@@ -72,6 +101,9 @@ def interactive_select_files(
 
     # Mode toggling state - per-file modes (dict[file_path, set[modes]])
     logger.debug(f"UI note_keys = {note_keys}")
+    sorted_modes = sorted(note_keys)
+    # Pressed key -> mode it toggles (the first mode wins if keys repeat)
+    mode_by_key = {key: mode for mode, key in reversed(note_keys.items())}
     file_modes = {}
 
     # Initialize modes for all files
@@ -94,42 +126,70 @@ def interactive_select_files(
     # Cache for metadata to avoid recomputing
     metadata_cache = {}
 
+    # Stat each file once; the sort and the file details below share the result
+    stat_cache = {file_path: file_path.stat() for file_path in files}
+
     # Sort files by last modified (newest first)
-    files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
+    files.sort(key=lambda p: stat_cache[p].st_mtime, reverse=True)
+
+    # Durations remembered from earlier runs; still valid while mtime and size match
+    duration_cache = DurationCache(logger=logger)
+
+    def read_duration(file_path: Path):
+        """Read a file's duration from the cache, or its header on a miss."""
+        stat = stat_cache[file_path]
+        hit, duration = duration_cache.get(file_path, stat)
+        if not hit:
+            duration = get_audio_duration(file_path)
+            duration_cache.put(file_path, stat, duration)
+        return duration
+
+    # Read durations for all files in the background, in display order, so
+    # changing pages doesn't stall on reading each file's header
+    duration_executor = ThreadPoolExecutor(max_workers=min(8, len(files)))
+    duration_futures = {
+        file_path: duration_executor.submit(read_duration, file_path)
+        for file_path in files
+    }
+
+    # List the transcript and note folders once; the processed markers are
+    # then name lookups instead of a stat per file and mode
+    processed_names = _list_names(output_folder)
+    names_by_folder = {}
+    processed_notes = {}
+    for mode_upper, folder in (llm_output_map or {}).items():
+        if folder not in names_by_folder:
+            names_by_folder[folder] = _list_names(folder)
+        processed_notes[mode_upper] = names_by_folder[folder]
 
     def get_file_info(file_path: Path):
-        """Get cached file info, computing duration lazily."""
+        """Get cached file info, waiting for the prefetched duration if needed."""
         if file_path not in metadata_cache:
-            stat = file_path.stat()
+            stat = stat_cache[file_path]
             modified_dt = datetime.fromtimestamp(stat.st_mtime)
             modified_str = f"{modified_dt.strftime('%Y-%m-%d %H:%M')} ({format_time_ago(modified_dt)})"
             size_str = format_file_size(stat.st_size)
 
-            # Compute duration lazily (expensive operation)
-            duration = get_audio_duration(file_path)
+            # Prefetched in the background; blocks only if not read yet
+            duration = duration_futures[file_path].result()
             duration_str = format_duration(duration)
 
             # Check if file has been processed
-            output_file = output_folder / f"{file_path.stem}{dot_ext}"
-            processed = output_file.exists()
+            processed = f"{file_path.stem}{dot_ext}" in processed_names
 
             # Get mode status for this file
             modes_status = {}
             processed_modes = {}
-            for mode in sorted(note_keys.keys()):
+            for mode in sorted_modes:
                 modes_status[mode] = mode in file_modes[file_path]
 
                 # Check if LLM output file exists for this mode
-                if llm_output_map:
-                    mode_upper = note_keys[mode]  # e.g., 'Q', 'W', 'E'
-                    if mode_upper in llm_output_map:
-                        llm_output_file = (
-                            llm_output_map[mode_upper]
-                            / f"{file_path.stem}.{mode_upper}{dot_ext}"
-                        )
-                        processed_modes[mode] = llm_output_file.exists()
-                    else:
-                        processed_modes[mode] = False
+                mode_upper = note_keys[mode]  # e.g., 'Q', 'W', 'E'
+                if mode_upper in processed_notes:
+                    processed_modes[mode] = (
+                        f"{file_path.stem}.{mode_upper}{dot_ext}"
+                        in processed_notes[mode_upper]
+                    )
                 else:
                     processed_modes[mode] = False
 
@@ -152,150 +212,163 @@ def interactive_select_files(
         end_idx = min(start_idx + page_size, len(files))
         return files[start_idx:end_idx]
 
-    with Live(console=console, refresh_per_second=10, auto_refresh=False) as live:
-        while True:
-            # Get current page files and build info
-            current_page_files = get_current_page_files()
-            file_infos = [get_file_info(f) for f in current_page_files]
-
-            # Create table
-            selected_count = len(selected_paths)
-            start_idx = current_page * page_size
-            end_idx = min(start_idx + page_size, len(files))
-
-            # Build title without global mode status (now per-file)
-            title = f"Page {current_page + 1}/{total_pages} — Showing {start_idx + 1}-{end_idx} of {len(files)} — ↑↓/Space select, Q/W/E toggle current file, ←→ pages, Enter confirm, Esc cancel ({selected_count} selected) — ✓ processed, o queued, - off"
-            table = Table(title=title, title_style="bold blue")
-            table.add_column("Sel", style="red", justify="center", width=3)
-            table.add_column("Done", style="bright_green", justify="center", width=5)
-            table.add_column("Q", style="cyan", justify="center", width=3)
-            table.add_column("W", style="cyan", justify="center", width=3)
-            table.add_column("E", style="cyan", justify="center", width=3)
-            table.add_column("Filename", style="green")
-            table.add_column("Modified", style="yellow")
-            table.add_column("Size", style="magenta", justify="right")
-            table.add_column("Duration", style="blue", justify="center")
-
-            # Add rows for current page
-            for i, info in enumerate(file_infos):
-                sel_marker = "*" if info["path"] in selected_paths else ""
-                processed_marker = "✓" if info["processed"] else "-"
-
-                # Mode status indicators - tri-state: ✓ processed, o queued, - off
-                def get_mode_marker(mode_key: str) -> str:
-                    if info["processed_modes"].get(mode_key, False):
-                        return "✓"  # processed
-                    elif info["modes"].get(mode_key, False):
-                        return "o"  # queued to process
-                    else:
-                        return "-"  # not selected
-
-                q_marker = get_mode_marker("q")
-                w_marker = get_mode_marker("w")
-                e_marker = get_mode_marker("e")
-
-                style = "black on cyan" if i == current_index else None
-                table.add_row(
-                    sel_marker,
-                    processed_marker,
-                    q_marker,
-                    w_marker,
-                    e_marker,
-                    info["name"],
-                    info["modified_str"],
-                    info["size_str"],
-                    info["duration_str"],
-                    style=style,
-                )
+    # Table for the current page, rebuilt only when its content changes;
+    # moving the cursor just restyles two rows
+    table = None
+
+    try:
+        with Live(console=console, refresh_per_second=10, auto_refresh=False) as live:
+            while True:
+                current_page_files = get_current_page_files()
+                if table is None:
+                    file_infos = [get_file_info(f) for f in current_page_files]
+
+                    # Create table
+                    selected_count = len(selected_paths)
+                    start_idx = current_page * page_size
+                    end_idx = min(start_idx + page_size, len(files))
+
+                    # Build title without global mode status (now per-file)
+                    title = f"Page {current_page + 1}/{total_pages} — Showing {start_idx + 1}-{end_idx} of {len(files)} — ↑↓/Space select, Q/W/E toggle current file, ←→ pages, Enter confirm, Esc cancel ({selected_count} selected) — ✓ processed, o queued, - off"
+                    table = Table(title=title, title_style="bold blue")
+                    table.add_column("Sel", style="red", justify="center", width=3)
+                    table.add_column(
+                        "Done", style="bright_green", justify="center", width=5
+                    )
+                    table.add_column("Q", style="cyan", justify="center", width=3)
+                    table.add_column("W", style="cyan", justify="center", width=3)
+                    table.add_column("E", style="cyan", justify="center", width=3)
+                    table.add_column("Filename", style="green")
+                    table.add_column("Modified", style="yellow")
+                    table.add_column("Size", style="magenta", justify="right")
+                    table.add_column("Duration", style="blue", justify="center")
+
+                    # Add rows for current page
+                    for i, info in enumerate(file_infos):
+                        sel_marker = "*" if info["path"] in selected_paths else ""
+                        processed_marker = "✓" if info["processed"] else "-"
+
+                        # Mode status indicators - tri-state: ✓ processed, o queued, - off
+                        processed_modes = info["processed_modes"]
+                        modes = info["modes"]
+                        q_marker, w_marker, e_marker = (
+                            _MODE_MARKERS[
+                                processed_modes.get(mode_key, False),
+                                modes.get(mode_key, False),
+                            ]
+                            for mode_key in "qwe"
+                        )
 
-            live.update(table)
-            live.refresh()
+                        style = _CURSOR_STYLE if i == current_index else None
+                        table.add_row(
+                            sel_marker,
+                            processed_marker,
+                            q_marker,
+                            w_marker,
+                            e_marker,
+                            info["name"],
+                            info["modified_str"],
+                            info["size_str"],
+                            info["duration_str"],
+                            style=style,
+                        )
 
-            # Get key press
-            try:
-                from readchar import readkey, key as rkey
+                live.update(table)
+                live.refresh()
 
-                k = readkey()
-            except ImportError:
-                console.print(
-                    "[red]readchar not installed. Install with: pip install readchar[/red]"
-                )
-                return None
+                # Get key press
+                try:
+                    from readchar import readkey, key as rkey
 
-            # Handle keys
-            if k == rkey.UP:
-                current_index = (current_index - 1) % len(current_page_files)
-            elif k == rkey.DOWN:
-                current_index = (current_index + 1) % len(current_page_files)
-            elif k == rkey.LEFT:
-                # Previous page
-                current_page = (current_page - 1) % total_pages
-                current_index = 0
-            elif k == rkey.RIGHT:
-                # Next page
-                current_page = (current_page + 1) % total_pages
-                current_index = 0
-            elif k == rkey.SPACE:
-                # Toggle selection for current file
-                current_file = current_page_files[current_index]
-                if current_file in selected_paths:
-                    selected_paths.remove(current_file)
-                else:
-                    selected_paths.add(current_file)
-            elif k in (rkey.ENTER, rkey.CR):
-                # Return selected files with their individual mode configurations
-                if selected_paths:
-                    # Build result with per-file mode configurations
-                    result_files = list(selected_paths)
-                    # Convert lowercase modes back to uppercase for CLI compatibility
-                    result_modes = {
-                        file: {mode.upper() for mode in file_modes[file]}
-                        for file in result_files
-                    }
-                    # Debug logging for selected files
-                    for file in result_files:
-                        modes = result_modes[file]
+                    k = readkey()
+                except ImportError:
+                    console.print(
+                        "[red]readchar not installed. Install with: pip install readchar[/red]"
+                    )
+                    return None
+
+                # Handle keys
+                if k == rkey.UP:
+                    old_index = current_index
+                    current_index = (current_index - 1) % len(current_page_files)
+                    _move_cursor(table, old_index, current_index)
+                elif k == rkey.DOWN:
+                    old_index = current_index
+                    current_index = (current_index + 1) % len(current_page_files)
+                    _move_cursor(table, old_index, current_index)
+                elif k == rkey.LEFT:
+                    # Previous page
+                    current_page = (current_page - 1) % total_pages
+                    current_index = 0
+                    table = None
+                elif k == rkey.RIGHT:
+                    # Next page
+                    current_page = (current_page + 1) % total_pages
+                    current_index = 0
+                    table = None
+                elif k == rkey.SPACE:
+                    # Toggle selection for current file
+                    current_file = current_page_files[current_index]
+                    if current_file in selected_paths:
+                        selected_paths.remove(current_file)
+                    else:
+                        selected_paths.add(current_file)
+                    table = None
+                elif k in (rkey.ENTER, rkey.CR):
+                    # Return selected files with their individual mode configurations
+                    if selected_paths:
+                        # Build result with per-file mode configurations
+                        result_files = list(selected_paths)
+                        # Convert lowercase modes back to uppercase for CLI compatibility
+                        result_modes = {
+                            file: {mode.upper() for mode in file_modes[file]}
+                            for file in result_files
+                        }
+                        # Debug logging for selected files
+                        for file in result_files:
+                            modes = result_modes[file]
+                            logger.debug(
+                                f"UI selected: {file.name} -> modes: {''.join(sorted(modes)) if modes else 'None'}"
+                            )
+                        return result_files, result_modes
+                    else:
+                        # No files explicitly selected - return the highlighted file with its current modes (may be empty)
+                        current_file = current_page_files[current_index]
+                        modes = file_modes[current_file]
+                        # Convert lowercase modes back to uppercase for CLI compatibility
+                        uppercase_modes = {mode.upper() for mode in modes}
                         logger.debug(
-                            f"UI selected: {file.name} -> modes: {''.join(sorted(modes)) if modes else 'None'}"
+                            f"UI current: {current_file.name} -> modes: {''.join(sorted(uppercase_modes)) if uppercase_modes else 'None'}"
                         )
-                    return result_files, result_modes
-                else:
-                    # No files explicitly selected - return the highlighted file with its current modes (may be empty)
+                        return [current_file], {current_file: uppercase_modes}
+                elif k in (rkey.ESC,):
+                    return None
+                elif k.upper() in mode_by_key:
+                    # Toggle mode for the current file
+                    mode = mode_by_key[k.upper()]
                     current_file = current_page_files[current_index]
-                    modes = file_modes[current_file]
-                    # Convert lowercase modes back to uppercase for CLI compatibility
-                    uppercase_modes = {mode.upper() for mode in modes}
+
+                    old_modes = file_modes[current_file].copy()
+                    if mode in file_modes[current_file]:
+                        file_modes[current_file].remove(mode)
+                        logger.debug(f"UI removed {mode} from {current_file.name}")
+                    else:
+                        file_modes[current_file].add(mode)
+                        logger.debug(f"UI added {mode} to {current_file.name}")
+
                     logger.debug(
-                        f"UI current: {current_file.name} -> modes: {''.join(sorted(uppercase_modes)) if uppercase_modes else 'None'}"
+                        f"UI {current_file.name} modes changed from {old_modes} to {file_modes[current_file]}"
                     )
-                    return [current_file], {current_file: uppercase_modes}
-            elif k in (rkey.ESC,):
-                return None
-            elif k.upper() in note_keys.values():
-                # Toggle mode for the current file
-                pressed_key = k.upper()
-                current_file = current_page_files[current_index]
-
-                for mode, key in note_keys.items():
-                    if key == pressed_key:
-                        old_modes = file_modes[current_file].copy()
-                        if mode in file_modes[current_file]:
-                            file_modes[current_file].remove(mode)
-                            logger.debug(f"UI removed {mode} from {current_file.name}")
-                        else:
-                            file_modes[current_file].add(mode)
-                            logger.debug(f"UI added {mode} to {current_file.name}")
 
-                        logger.debug(
-                            f"UI {current_file.name} modes changed from {old_modes} to {file_modes[current_file]}"
+                    # Update cache to reflect the change
+                    if current_file in metadata_cache:
+                        metadata_cache[current_file]["modes"][mode] = (
+                            mode in file_modes[current_file]
                         )
-
-                        # Update cache to reflect the change
-                        if current_file in metadata_cache:
-                            metadata_cache[current_file]["modes"][mode] = (
-                                mode in file_modes[current_file]
-                            )
-                        break
+                    table = None
+    finally:
+        duration_executor.shutdown(wait=False, cancel_futures=True)
+        duration_cache.save()
 
 
 def interactive_select_events(
@@ -380,46 +453,51 @@ def interactive_select_events(
         end_idx = min(start_idx + page_size, len(events))
         return events[start_idx:end_idx]
 
+    # Table for the current page, rebuilt only when its content changes;
+    # moving the cursor just restyles two rows
+    table = None
+
     with Live(console=console, refresh_per_second=10, auto_refresh=False) as live:
         while True:
-            # Get current page events and build info
             current_page_events = get_current_page_events()
-            event_infos = [get_event_info(event) for event in current_page_events]
-
-            # Create table
-            selected_count = len(selected_indices)
             start_idx = current_page * page_size
-            end_idx = min(start_idx + page_size, len(events))
-
-            # Build title with date range info if available
-            date_info = ""
-            if current_start_date and current_end_date:
-                start_str = current_start_date.strftime("%Y-%m-%d")
-                end_str = current_end_date.strftime("%Y-%m-%d")
-                date_info = f" ({start_str} to {end_str})"
-
-            nav_info = "P previous day, " if reload_callback else ""
-            title = f"Page {current_page + 1}/{total_pages} — Showing {start_idx + 1}-{end_idx} of {len(events)}{date_info} — ↑↓/Space select, ←→ pages, {nav_info}Enter confirm, Esc cancel ({selected_count} selected)"
-            table = Table(title=title, title_style="bold blue")
-            table.add_column("Sel", style="red", justify="center", width=3)
-            table.add_column("Start (Local)", style="cyan")
-            table.add_column("Title", style="green")
-            table.add_column("Attendees", style="yellow")
-            table.add_column("Attachments", style="magenta")
-
-            # Add rows for current page
-            for i, info in enumerate(event_infos):
-                global_index = start_idx + i
-                sel_marker = "*" if global_index in selected_indices else ""
-                style = "black on cyan" if i == current_index else None
-                table.add_row(
-                    sel_marker,
-                    info["start_str"],
-                    info["title"],
-                    info["attendees_str"],
-                    info["attachments_str"],
-                    style=style,
-                )
+
+            if table is None:
+                event_infos = [get_event_info(event) for event in current_page_events]
+
+                # Create table
+                selected_count = len(selected_indices)
+                end_idx = min(start_idx + page_size, len(events))
+
+                # Build title with date range info if available
+                date_info = ""
+                if current_start_date and current_end_date:
+                    start_str = current_start_date.strftime("%Y-%m-%d")
+                    end_str = current_end_date.strftime("%Y-%m-%d")
+                    date_info = f" ({start_str} to {end_str})"
+
+                nav_info = "P previous day, " if reload_callback else ""
+                title = f"Page {current_page + 1}/{total_pages} — Showing {start_idx + 1}-{end_idx} of {len(events)}{date_info} — ↑↓/Space select, ←→ pages, {nav_info}Enter confirm, Esc cancel ({selected_count} selected)"
+                table = Table(title=title, title_style="bold blue")
+                table.add_column("Sel", style="red", justify="center", width=3)
+                table.add_column("Start (Local)", style="cyan")
+                table.add_column("Title", style="green")
+                table.add_column("Attendees", style="yellow")
+                table.add_column("Attachments", style="magenta")
+
+                # Add rows for current page
+                for i, info in enumerate(event_infos):
+                    global_index = start_idx + i
+                    sel_marker = "*" if global_index in selected_indices else ""
+                    style = _CURSOR_STYLE if i == current_index else None
+                    table.add_row(
+                        sel_marker,
+                        info["start_str"],
+                        info["title"],
+                        info["attendees_str"],
+                        info["attachments_str"],
+                        style=style,
+                    )
 
             live.update(table)
             live.refresh()
@@ -437,17 +515,23 @@ def interactive_select_events(
 
             # Handle keys
             if k == rkey.UP:
+                old_index = current_index
                 current_index = (current_index - 1) % len(current_page_events)
+                _move_cursor(table, old_index, current_index)
             elif k == rkey.DOWN:
+                old_index = current_index
                 current_index = (current_index + 1) % len(current_page_events)
+                _move_cursor(table, old_index, current_index)
             elif k == rkey.LEFT:
                 # Previous page
                 current_page = (current_page - 1) % total_pages
                 current_index = 0
+                table = None
             elif k == rkey.RIGHT:
                 # Next page
                 current_page = (current_page + 1) % total_pages
                 current_index = 0
+                table = None
             elif k.upper() == "P" and reload_callback and current_start_date:
                 # Previous day navigation
                 from datetime import timedelta
@@ -482,6 +566,7 @@ def interactive_select_events(
                         selected_indices.clear()
                         total_pages = ceil(len(events) / page_size)
                         event_cache.clear()  # Clear cache for new events
+                        table = None
 
                         logger.info(f"Loaded {len(new_events)} events for previous day")
                     else:
@@ -498,6 +583,7 @@ def interactive_select_events(
                     selected_indices.remove(global_index)
                 else:
                     selected_indices.add(global_index)
+                table = None
             elif k in (rkey.ENTER, rkey.CR):
                 # Return selected events with date info
                 if selected_indices:
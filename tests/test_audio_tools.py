@@ -0,0 +1,25 @@
+from pathlib import Path
+from unittest.mock import patch
+
+from app.services.audio_tools import iter_remove_silence_batch
+
+
+def test_remove_silence_batch_results_have_a_length():
+    """Test that batch results report their size up front and yield one entry per file"""
+    pairs = [(Path("a.wav"), Path("a.nosil.wav")), (Path("b.wav"), Path("b.nosil.wav"))]
+
+    def fake_remove_silence(input_path, output_path, **options):
+        if input_path.name == "b.wav":
+            raise ValueError("unreadable")
+        return output_path
+
+    with patch(
+        "app.services.audio_tools.remove_silence", side_effect=fake_remove_silence
+    ):
+        results = iter_remove_silence_batch(pairs, workers=1)
+        assert len(results) == 2
+        collected = list(results)
+
+    assert collected[0] == (Path("a.wav"), Path("a.nosil.wav"), None)
+    assert collected[1][:2] == (Path("b.wav"), Path("b.nosil.wav"))
+    assert isinstance(collected[1][2], ValueError)
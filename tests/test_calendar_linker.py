@@ -0,0 +1,207 @@
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+from app.core.config_models import GoogleConfig
+from app.services.calendar_linker import CalendarLinker, _EventIndex
+
+BASE = datetime(2025, 1, 6, 9, 0, tzinfo=timezone.utc)
+
+
+def _event(name, start_min, end_min):
+    """Build a (start, end, event) tuple relative to BASE"""
+    return (
+        BASE + timedelta(minutes=start_min),
+        BASE + timedelta(minutes=end_min),
+        {"summary": name},
+    )
+
+
+def _closest(index, moment):
+    ts = moment.timestamp()
+    cutoff = index.count_before(ts)
+    idx = index.closest_before(ts, cutoff)
+    return None if idx is None else index.events[idx]["summary"]
+
+
+def test_event_index_ignores_events_starting_after_moment():
+    """Test that only events starting before the moment are candidates"""
+    index = _EventIndex([_event("later", 30, 60)])
+
+    assert _closest(index, BASE + timedelta(minutes=10)) is None
+
+
+def test_event_index_prefers_running_event():
+    """Test that an earlier long meeting still running beats a recent short one"""
+    index = _EventIndex(
+        [
+            _event("short", 50, 55),
+            _event("long", 0, 120),
+        ]
+    )
+
+    assert _closest(index, BASE + timedelta(minutes=60)) == "long"
+
+
+def test_event_index_picks_latest_ended_event():
+    """Test that when nothing is running, the event that ended last wins"""
+    index = _EventIndex(
+        [
+            _event("first", 0, 30),
+            _event("second", 10, 45),
+            _event("third", 20, 40),
+        ]
+    )
+
+    assert _closest(index, BASE + timedelta(minutes=90)) == "second"
+
+
+def test_event_index_breaks_ties_by_earliest_start():
+    """Test that among running events the earliest-starting one wins"""
+    index = _EventIndex(
+        [
+            _event("b", 10, 120),
+            _event("a", 0, 60),
+        ]
+    )
+
+    assert _closest(index, BASE + timedelta(minutes=30)) == "a"
+
+
+def _linker():
+    """Build a CalendarLinker whose Google client is a mock"""
+    with patch("app.services.calendar_linker.GoogleCalendarClient"):
+        return CalendarLinker(GoogleConfig(), logging.getLogger("test"))
+
+
+@pytest.fixture
+def dublin_time(monkeypatch):
+    """Run the test with a local timezone that observes DST"""
+    if not hasattr(time, "tzset"):
+        pytest.skip("time.tzset is not available on this platform")
+    monkeypatch.setenv("TZ", "Europe/Dublin")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def test_event_times_use_offset_of_each_date(dublin_time):
+    """Test that winter and summer events get their own UTC offsets"""
+    linker = _linker()
+    winter = {"start": {"dateTime": "2025-01-15T10:00:00Z"}}
+    summer = {"start": {"dateTime": "2025-07-15T10:00:00Z"}}
+
+    winter_start, _ = linker._parse_event_times(winter)
+    summer_start, _ = linker._parse_event_times(summer)
+
+    assert winter_start.utcoffset() == timedelta(0)
+    assert summer_start.utcoffset() == timedelta(hours=1)
+    assert summer_start.hour == 11
+
+
+def test_all_day_event_starts_at_local_midnight(dublin_time):
+    """Test that an all-day summer event starts at local, not winter, midnight"""
+    linker = _linker()
+    event = {"start": {"date": "2025-07-15"}, "end": {"date": "2025-07-16"}}
+
+    start, end = linker._parse_event_times(event)
+
+    assert start == datetime(2025, 7, 14, 23, 0, tzinfo=timezone.utc)
+    assert end - start == timedelta(days=1)
+
+
+class _FakeCalendar:
+    """Stands in for GoogleCalendarClient.list_events_between, recording calls"""
+
+    def __init__(self, events):
+        self.events = sorted(events, key=lambda e: e[0])
+        self.calls = []
+
+    def list_events_between(self, start, end, filter_group_events=None, limit=None):
+        self.calls.append((start, end, limit))
+        # Like the API: events overlapping the window, by start time, one page
+        return [
+            {
+                "summary": name,
+                "start": {"dateTime": s.isoformat()},
+                "end": {"dateTime": e.isoformat()},
+            }
+            for s, e, name in self.events
+            if e > start and s < end
+        ][:limit]
+
+
+def _matching_linker(events, **cfg):
+    with patch("app.services.calendar_linker.GoogleCalendarClient"):
+        linker = CalendarLinker(
+            GoogleConfig(filter_group_events_only=False, **cfg),
+            logging.getLogger("test"),
+        )
+    linker.client = _FakeCalendar(events)
+    return linker
+
+
+def _at(minutes):
+    return BASE + timedelta(minutes=minutes)
+
+
+def _summaries(results):
+    return {path.name: event and event["summary"] for path, event in results.items()}
+
+
+def test_match_files_fetches_nearby_files_together(tmp_path):
+    """Test that files within a day share one request and still get their own events"""
+    linker = _matching_linker(
+        [(_at(0), _at(30), "standup"), (_at(240), _at(300), "review")],
+        match_tolerance_minutes=60,
+    )
+    a, b = tmp_path / "a.wav", tmp_path / "b.wav"
+
+    results = linker.match_files(
+        [a, b], {a: _at(35).timestamp(), b: _at(290).timestamp()}
+    )
+
+    assert _summaries(results) == {"a.wav": "standup", "b.wav": "review"}
+    assert len(linker.client.calls) == 1
+
+
+def test_match_files_fetches_distant_files_separately(tmp_path):
+    """Test that files more than a day apart are not fetched as one window"""
+    linker = _matching_linker(
+        [
+            (_at(0), _at(30), "monday"),
+            (_at(2 * 24 * 60), _at(2 * 24 * 60 + 30), "wednesday"),
+        ],
+        match_tolerance_minutes=60,
+    )
+    a, b = tmp_path / "a.wav", tmp_path / "b.wav"
+
+    results = linker.match_files(
+        [a, b], {a: _at(20).timestamp(), b: _at(2 * 24 * 60 + 20).timestamp()}
+    )
+
+    assert _summaries(results) == {"a.wav": "monday", "b.wav": "wednesday"}
+    assert len(linker.client.calls) == 2
+
+
+def test_match_files_queries_each_file_when_group_limit_is_hit(tmp_path):
+    """Test that a full group page falls back to per-file windows instead of truncating"""
+    busy_morning = [(_at(5 * i), _at(5 * i + 4), f"slot{i}") for i in range(4)]
+    linker = _matching_linker(
+        busy_morning + [(_at(210), _at(250), "afternoon")],
+        match_tolerance_minutes=30,
+        max_results=2,
+    )
+    a, b = tmp_path / "a.wav", tmp_path / "b.wav"
+
+    results = linker.match_files(
+        [a, b], {a: _at(8).timestamp(), b: _at(240).timestamp()}
+    )
+
+    # The combined page (limit 4) holds only the morning slots
+    assert _summaries(results) == {"a.wav": "slot1", "b.wav": "afternoon"}
+    assert [limit for _, _, limit in linker.client.calls] == [4, 2, 2]
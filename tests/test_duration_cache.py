@@ -0,0 +1,33 @@
+import json
+
+from app.core.duration_cache import DurationCache
+
+
+def test_save_drops_entries_for_missing_files(tmp_path):
+    """Test that entries for files that are gone are not written back"""
+    kept = tmp_path / "kept.wav"
+    kept.write_bytes(b"audio")
+    listed = tmp_path / "listed.wav"
+    listed.write_bytes(b"audio")
+    cache_file = tmp_path / "durations.json"
+    cache_file.write_text(
+        json.dumps(
+            {
+                str(kept): [1, 5, 60.0],
+                str(tmp_path / "deleted.wav"): [1, 5, 30.0],
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    cache = DurationCache(cache_file)
+    stat = listed.stat()
+    cache.put(listed, stat, 90.0)
+    listed.unlink()
+    cache.save()
+
+    saved = json.loads(cache_file.read_text(encoding="utf-8"))
+    assert saved == {
+        str(kept): [1, 5, 60.0],
+        str(listed): [stat.st_mtime_ns, stat.st_size, 90.0],
+    }
@@ -0,0 +1,209 @@
+import logging
+import threading
+from unittest.mock import MagicMock
+
+from app.core.config_models import (
+    AppConfig,
+    DeepgramConfig,
+    PathsConfig,
+    ProcessingConfig,
+)
+from app.services.file_processor import FileProcessor
+
+
+def _processor(tmp_path, concurrency=2):
+    cfg = AppConfig(
+        deepgram=DeepgramConfig(api_key="test"),
+        paths=PathsConfig(input_folder=tmp_path / "in", output_folder=tmp_path / "out"),
+        processing=ProcessingConfig(batch_concurrency=concurrency),
+    )
+    (tmp_path / "in").mkdir()
+    (tmp_path / "out").mkdir()
+    return FileProcessor(cfg, logging.getLogger("test"))
+
+
+def _audio_files(tmp_path, *names):
+    files = []
+    for name in names:
+        path = tmp_path / "in" / name
+        path.write_bytes(b"audio")
+        files.append(path)
+    return files
+
+
+class _ParallelTranscriber:
+    """Transcriber that only returns once `parties` files are being transcribed at once"""
+
+    def __init__(self, parties):
+        self.barrier = threading.Barrier(parties, timeout=5)
+
+    def process_audio_file(self, path):
+        self.barrier.wait()
+        return f"transcript of {path.name}"
+
+
+def _linker(stem):
+    """Calendar linker stand-in that matches every file to the same event"""
+    linker = MagicMock()
+    linker.USER_CANCELLED = object()
+    linker.match_files.side_effect = lambda files, mtimes=None: {
+        f: {"summary": stem} for f in files
+    }
+    linker.compute_target_stem.return_value = stem
+    linker.format_event_metadata.return_value = "## Linked Calendar Event"
+    return linker
+
+
+def test_concurrent_batch_reserves_distinct_output_names(tmp_path):
+    """Test that files linked to the same event get distinct outputs when run in parallel"""
+    processor = _processor(tmp_path)
+    files = _audio_files(tmp_path, "a.wav", "b.wav")
+    out = tmp_path / "out"
+    (out / "Standup.md").write_text("earlier meeting", encoding="utf-8")
+
+    processed, skipped = processor.run_batch(
+        files,
+        reprocess=False,
+        transcriber=_ParallelTranscriber(2),
+        output_folder=out,
+        calendar_linker=_linker("Standup"),
+    )
+
+    assert (processed, skipped) == (2, 0)
+    assert (out / "Standup.md").read_text(encoding="utf-8") == "earlier meeting"
+    written = sorted(p.name for p in out.iterdir() if p.name != "Standup.md")
+    assert written == ["Standup (1).md", "Standup (2).md"]
+    bodies = {
+        (out / name).read_text(encoding="utf-8").split("\n\n", 1)[1] for name in written
+    }
+    assert bodies == {"transcript of a.wav", "transcript of b.wav"}
+
+
+def test_write_output_keeps_file_created_by_another_process(tmp_path):
+    """Test that an output appearing after planning is not overwritten"""
+    processor = _processor(tmp_path)
+    target = tmp_path / "out" / "meeting.md"
+    target.write_text("from another run", encoding="utf-8")
+    existing = set()
+
+    assert not processor._write_output(target, "new transcript", False, existing)
+    assert target.read_text(encoding="utf-8") == "from another run"
+    assert existing == set()
+
+    assert processor._write_output(target, "new transcript", True, existing)
+    assert target.read_text(encoding="utf-8") == "new transcript"
+    assert existing == {"meeting"}
+
+
+def test_batch_skips_output_created_during_transcription(tmp_path):
+    """Test that a file is counted as skipped when its output shows up mid-batch"""
+    processor = _processor(tmp_path, concurrency=1)
+    files = _audio_files(tmp_path, "meeting.wav")
+    target = tmp_path / "out" / "meeting.md"
+    transcriber = MagicMock()
+
+    def transcribe(path):
+        target.write_text("from another run", encoding="utf-8")
+        return "new transcript"
+
+    transcriber.process_audio_file.side_effect = transcribe
+
+    processed, skipped = processor.run_batch(
+        files, reprocess=False, transcriber=transcriber, output_folder=tmp_path / "out"
+    )
+
+    assert (processed, skipped) == (0, 1)
+    assert target.read_text(encoding="utf-8") == "from another run"
+
+
+def test_batch_defers_llm_notes_until_transcription_is_done(tmp_path):
+    """Test that a batch sends every file's LLM request together at the end"""
+    processor = _processor(tmp_path)
+    files = _audio_files(tmp_path, "a.wav", "b.wav")
+    llm_generator = MagicMock()
+    llm_generator.list_existing_notes.return_value = set()
+
+    def transcribe(path):
+        assert not llm_generator.generate_for_files.called
+        return f"transcript of {path.name}"
+
+    transcriber = MagicMock()
+    transcriber.process_audio_file.side_effect = transcribe
+
+    processed, skipped = processor.run_batch(
+        files,
+        reprocess=False,
+        transcriber=transcriber,
+        output_folder=tmp_path / "out",
+        llm_generator=llm_generator,
+        llm_modes={"q"},
+    )
+
+    assert (processed, skipped) == (2, 0)
+    llm_generator.generate_for_modes.assert_not_called()
+    llm_generator.generate_for_files.assert_called_once()
+    (jobs,) = llm_generator.generate_for_files.call_args.args
+    assert sorted((job[0], job[1], job[2]) for job in jobs) == [
+        ("transcript of a.wav", frozenset({"Q"}), "a"),
+        ("transcript of b.wav", frozenset({"Q"}), "b"),
+    ]
+
+
+def test_migrate_output_prepends_metadata_once(tmp_path):
+    """Test that migration adds the calendar block unless the original already has one"""
+    processor = _processor(tmp_path)
+    out = tmp_path / "out"
+    plain = out / "plain.md"
+    plain.write_text("transcript", encoding="utf-8")
+    linked = out / "linked.md"
+    linked.write_text("## Linked Calendar Event\nold\n\ntranscript", encoding="utf-8")
+    existing = {"plain", "linked"}
+
+    assert processor._migrate_output(
+        plain, out / "Standup.md", "## Linked Calendar Event\nnew", existing
+    )
+    assert processor._migrate_output(
+        linked, out / "Retro.md", "## Linked Calendar Event\nnew", existing
+    )
+
+    assert (out / "Standup.md").read_text(encoding="utf-8") == (
+        "## Linked Calendar Event\nnew\n\ntranscript"
+    )
+    assert (out / "Retro.md").read_text(encoding="utf-8") == linked.read_text(
+        encoding="utf-8"
+    )
+    assert plain.exists() and linked.exists()
+    assert existing == {"plain", "linked", "Standup", "Retro"}
+
+
+def test_failed_migration_does_not_fall_through_to_transcription(tmp_path):
+    """Test that a migration target created by another process skips the file untouched"""
+    processor = _processor(tmp_path)
+    (file,) = _audio_files(tmp_path, "meeting.wav")
+    out = tmp_path / "out"
+    original = out / "meeting.md"
+    original.write_text("transcript", encoding="utf-8")
+    target = out / "Standup.md"
+    target.write_text("from another run", encoding="utf-8")
+    transcriber = MagicMock()
+
+    result = processor._process_file(
+        file,
+        target,
+        "## Linked Calendar Event",
+        original,
+        False,
+        transcriber,
+        out,
+        None,
+        None,
+        False,
+        1000,
+        -40,
+        100,
+        existing_outputs={"meeting"},
+    )
+
+    assert result == (0, 1)
+    transcriber.process_audio_file.assert_not_called()
+    assert target.read_text(encoding="utf-8") == "from another run"
@@ -0,0 +1,156 @@
+import logging
+import sys
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from app.core.config_models import GoogleConfig
+from app.integrations.google_calendar import GoogleCalendarClient
+
+
+class _FakeRequest:
+    """events().list() request whose execute() waits for a second caller"""
+
+    def __init__(self, calendar_id, barrier):
+        self.calendar_id = calendar_id
+        self.barrier = barrier
+
+    def execute(self, http=None):
+        # Only returns if another request is executing at the same time
+        self.barrier.wait(timeout=5)
+        return {"items": [{"id": self.calendar_id}]}
+
+
+class _FakeEvents:
+    def __init__(self, barrier):
+        self.barrier = barrier
+
+    def list(self, calendarId, **kwargs):
+        return _FakeRequest(calendarId, self.barrier)
+
+
+class _FakeService:
+    def __init__(self, barrier):
+        self.barrier = barrier
+
+    def events(self):
+        return _FakeEvents(self.barrier)
+
+
+def _client(tmp_path, service):
+    credentials = tmp_path / "credentials.json"
+    credentials.write_text("{}")
+    cfg = GoogleConfig(
+        credentials_file=credentials,
+        token_file=tmp_path / "token.json",
+        filter_group_events_only=False,
+    )
+    with patch.object(GoogleCalendarClient, "_get_service", return_value=service):
+        return GoogleCalendarClient(cfg, logging.getLogger("test"))
+
+
+def test_calendars_are_fetched_in_parallel(tmp_path):
+    """Test that execute() calls for different calendars overlap instead of queuing"""
+    client = _client(tmp_path, _FakeService(threading.Barrier(2)))
+
+    # Without ijson the plain execute() path is used
+    with (
+        patch.dict(sys.modules, {"ijson": None}),
+        patch.object(client, "_new_http", return_value=None),
+    ):
+        events = client.list_past_events_for_calendars(["a", "b"])
+
+    assert events == {"a": [{"id": "a"}], "b": [{"id": "b"}]}
+
+
+def test_event_start_timestamp_orders_across_timezones():
+    """Test that events are ordered by instant, not by their formatted text"""
+    early = {"start": {"dateTime": "2025-01-06T10:00:00+02:00"}}
+    late = {"start": {"dateTime": "2025-01-06T09:30:00Z"}}
+
+    assert sorted([late, early], key=GoogleCalendarClient.event_start_timestamp) == [
+        early,
+        late,
+    ]
+
+
+class _FailingBody:
+    """Streamed response whose body breaks off after the given bytes"""
+
+    def __init__(self, data):
+        self.data = data
+        self.sent = False
+        self.decode_content = False
+
+    def read(self, size=-1):
+        if size == 0:
+            return b""
+        if self.sent:
+            raise ConnectionError("connection reset")
+        self.sent = True
+        return self.data
+
+
+class _FailingResponse:
+    def __init__(self, data):
+        self.raw = _FailingBody(data)
+
+    def raise_for_status(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class _Session:
+    def __init__(self, data):
+        self.data = data
+
+    def get(self, uri, stream=False):
+        return _FailingResponse(self.data)
+
+
+class _CountingRequest:
+    uri = "https://example.invalid/events"
+
+    def __init__(self):
+        self.executed = 0
+
+    def execute(self, http=None):
+        self.executed += 1
+        return {"items": [{"id": "1"}, {"id": "2"}]}
+
+
+def _stream_client(tmp_path, data):
+    client = _client(tmp_path, service=None)
+    client._session = _Session(data)
+    return client
+
+
+def test_streaming_failure_before_first_event_falls_back(tmp_path):
+    """Test that a stream failing before any event is retried with execute()"""
+    pytest.importorskip("ijson")
+    client = _stream_client(tmp_path, b'{"items": [')
+    request = _CountingRequest()
+
+    with patch.object(client, "_new_http", return_value=None):
+        items = list(client._iter_event_items(request))
+
+    assert items == [{"id": "1"}, {"id": "2"}]
+    assert request.executed == 1
+
+
+def test_streaming_failure_after_events_is_raised(tmp_path):
+    """Test that a stream failing mid-list is not retried, which could duplicate events"""
+    pytest.importorskip("ijson")
+    client = _stream_client(tmp_path, b'{"items": [{"id": "1"}, ')
+    request = _CountingRequest()
+
+    items = []
+    with pytest.raises(ConnectionError):
+        for item in client._iter_event_items(request):
+            items.append(item)
+
+    assert items == [{"id": "1"}]
+    assert request.executed == 0
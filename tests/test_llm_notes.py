@@ -0,0 +1,90 @@
+import logging
+
+from app.core.config_models import LLMConfig
+from app.services.llm_notes import _TRUNCATION_MARKER, LLMNotesGenerator
+
+
+class _Chunk:
+    def __init__(self, content):
+        self.content = content
+
+
+class _FakeChain:
+    """Chain stand-in that echoes the transcript back, failing for transcripts marked 'fail'"""
+
+    async def astream(self, prompt):
+        text = prompt["prompt"]
+        if "fail" in text:
+            raise RuntimeError("upstream error")
+        yield _Chunk("notes: ")
+        yield _Chunk(text.split("---\n", 1)[1].rsplit("\n---", 1)[0])
+
+
+def _generator(**overrides):
+    generator = LLMNotesGenerator(
+        LLMConfig(api_key="test", **overrides), logging.getLogger("test"), "md"
+    )
+    generator.chain = _FakeChain()
+    return generator
+
+
+def test_generate_for_files_isolates_failing_file(tmp_path, caplog):
+    """Test that one file's failed request neither stops nor leaks into the others"""
+    generator = _generator()
+    jobs = [
+        ("good meeting", frozenset({"Q", "E"}), "good", tmp_path, False),
+        ("fail meeting", frozenset({"Q"}), "bad", tmp_path, False),
+    ]
+
+    with caplog.at_level(logging.ERROR):
+        results = generator.generate_for_files(jobs)
+
+    assert results == [
+        {"Q": tmp_path / "good.Q.md", "E": tmp_path / "good.E.md"},
+        {},
+    ]
+    assert (tmp_path / "good.Q.md").read_text(encoding="utf-8") == "notes: good meeting"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["good.E.md", "good.Q.md"]
+    assert "Failed to generate LLM Q for bad" in caplog.text
+
+
+class _CharEncoding:
+    """Tokenizer stand-in with one token per character"""
+
+    def encode(self, text, disallowed_special=()):
+        return list(text)
+
+    def decode(self, tokens):
+        return "".join(tokens)
+
+
+def test_preprocess_content_collapses_repeated_lines():
+    """Test that consecutive duplicate lines are dropped but blank lines are kept"""
+    generator = _generator()
+
+    content = "hello\nhello\n\n\nbye\nhello"
+
+    assert generator._preprocess_content(content, "meeting") == "hello\n\n\nbye\nhello"
+
+
+def test_preprocess_content_keeps_head_and_tail_tokens():
+    """Test that a transcript over the token limit keeps its start and end"""
+    generator = _generator(max_input_tokens=10)
+    generator._encoding, generator._encoding_loaded = _CharEncoding(), True
+
+    assert generator._preprocess_content("0123456789", "meeting") == "0123456789"
+    assert generator._preprocess_content("abcdefghijklmnopqrstuvwxyz", "meeting") == (
+        "abcdef" + _TRUNCATION_MARKER + "wxyz"
+    )
+
+
+def test_preprocess_content_estimates_tokens_without_tokenizer():
+    """Test that trimming falls back to a character estimate without a tokenizer"""
+    generator = _generator(max_input_tokens=10)
+    generator._encoding, generator._encoding_loaded = None, True
+    content = "x" * 24 + "y" * 40 + "z" * 16
+
+    assert generator._preprocess_content(content[:40], "meeting") == content[:40]
+    assert generator._preprocess_content(content, "meeting") == (
+        "x" * 24 + _TRUNCATION_MARKER + "z" * 16
+    )